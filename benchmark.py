@@ -0,0 +1,117 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+from tournament_types import TournamentType
+from simulation import TournamentSimulator
+
+DEFAULT_FIELD_SIZES = [9, 100, 1_000, 10_000, 100_000]
+
+# Simulation phases and the manager operations each one exercises
+PHASES = {
+    'register': ['add_player'],
+    'play': ['update_chip_counts', 'process_knockout', 'process_multiway_allin', 'next_level',
+             'get_remaining_players', 'get_chip_stats', 'get_chip_leaders'],
+    'pay_out': ['get_player_prizes'],
+}
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        'calls': len(latencies),
+        'ops_per_sec': len(latencies) / total if total else 0.0,
+        'p50_us': percentile(latencies, 0.50) * 1e6,
+        'p90_us': percentile(latencies, 0.90) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'max_us': latencies[-1] * 1e6 if latencies else 0.0,
+    }
+
+def measure_memory(field_size: int, tournament_type: TournamentType, seed: int) -> Dict[str, int]:
+    """Peak traced memory of each simulation phase, in bytes.
+
+    Runs separately from the timing pass because tracemalloc slows every
+    allocation down.
+    """
+    simulator = TournamentSimulator(field_size, tournament_type, seed=seed)
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for phase in PHASES:
+            tracemalloc.reset_peak()
+            getattr(simulator, phase)()
+            peaks[phase] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+def run_benchmark(field_size: int, tournament_type: TournamentType = TournamentType.PKO,
+                  seed: int = 0, memory: bool = True) -> Dict:
+    latencies: Dict[str, List[float]] = {}
+
+    def timer(name: str, seconds: float) -> None:
+        latencies.setdefault(name, []).append(seconds)
+
+    simulator = TournamentSimulator(field_size, tournament_type, seed=seed, timer=timer)
+    start = time.perf_counter()
+    result = simulator.run()
+    wall = time.perf_counter() - start
+    report = {
+        'field_size': field_size,
+        'tournament_type': tournament_type.name,
+        'seed': seed,
+        'wall_seconds': wall,
+        'operations': {name: summarize(values) for name, values in sorted(latencies.items())},
+        'violations': result.violations,
+    }
+    if memory:
+        peaks = measure_memory(field_size, tournament_type, seed)
+        for phase, operations in PHASES.items():
+            for name in operations:
+                if name in report['operations']:
+                    report['operations'][name]['phase_peak_bytes'] = peaks[phase]
+    return report
+
+def print_report(report: Dict) -> None:
+    print(f"\n{report['tournament_type']} field of {report['field_size']:,} "
+          f"(seed {report['seed']}): {report['wall_seconds']:.3f} s")
+    print(f"  {'operation':<24}{'calls':>9}{'ops/s':>12}{'p50 us':>9}{'p90 us':>9}"
+          f"{'p99 us':>9}{'max us':>10}{'peak KiB':>10}")
+    for name, stats in report['operations'].items():
+        peak = stats.get('phase_peak_bytes')
+        print(f"  {name:<24}{stats['calls']:>9,}{stats['ops_per_sec']:>12,.0f}"
+              f"{stats['p50_us']:>9.1f}{stats['p90_us']:>9.1f}{stats['p99_us']:>9.1f}"
+              f"{stats['max_us']:>10.1f}{'' if peak is None else f'{peak / 1024:,.0f}':>10}")
+    for violation in report['violations']:
+        print(f"  INVARIANT VIOLATED: {violation}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark TournamentManager hot paths with simulated events")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_FIELD_SIZES)
+    parser.add_argument('--type', default='pko', choices=['regular', 'pko'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--json', help="also write the reports to this file")
+    args = parser.parse_args(argv)
+
+    tournament_type = TournamentType[args.type.upper()]
+    reports = []
+    for size in args.sizes:
+        report = run_benchmark(size, tournament_type, args.seed, memory=not args.no_memory)
+        print_report(report)
+        reports.append(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
+    return 1 if any(report['violations'] for report in reports) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+from tournament_types import BlindLevel
+
+# Blind and ante values are rounded to these mantissas times a power of ten
+_NICE_MANTISSAS = (1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0, 6.0, 7.5, 8.0, 10.0)
+
+@dataclass
+class FinishModel:
+    """Statistical model of how fast a field busts at a given depth.
+
+    Each table is assumed to lose ``bust_rate / M`` players per hand,
+    where M is the average stack over one orbit of blinds and antes, so
+    play speeds up as the blinds catch up with the stacks.
+    """
+    hands_per_hour: float = 30.0
+    table_size: int = 9
+    bust_rate: float = 1.0
+    step_minutes: float = 5.0
+    max_minutes: float = 7 * 24 * 60
+
+@dataclass
+class BlindPlan:
+    structure: List[BlindLevel]
+    level_minutes: int
+    growth: float
+    starting_depth: int  # starting stack in big blinds at level 1
+    mean_minutes: float
+    p10_minutes: float
+    p50_minutes: float
+    p90_minutes: float
+    rmse_minutes: float  # root mean squared distance from the target finish
+    candidates: int = 0
+    finish_minutes: List[float] = field(default_factory=list, repr=False)
+
+def nice_chips(value: float) -> int:
+    """Round a chip amount to the nearest value a floor would actually use"""
+    if value < 1:
+        return 1
+    scale = 10 ** math.floor(math.log10(value))
+    mantissa = min(_NICE_MANTISSAS, key=lambda m: abs(math.log(m * scale / value)))
+    return max(1, round(mantissa * scale))
+
+def build_structure(starting_stack: int, field_size: int, level_minutes: int, growth: float,
+                    starting_depth: int, break_every: int = 4, break_minutes: int = 15,
+                    ante_from_level: int = 4, ante_fraction: float = 0.125,
+                    max_levels: int = 80, first_big_blind: Optional[int] = None) -> List[BlindLevel]:
+    """Geometric blind schedule that runs until the field's chips are a few big blinds.
+
+    A break of ``break_minutes`` follows every ``break_every`` levels
+    (none when ``break_every`` is 0). Antes start at level
+    ``ante_from_level`` at roughly ``ante_fraction`` of the big blind.
+    ``first_big_blind`` starts the schedule at that big blind instead of
+    the one ``starting_depth`` gives, e.g. to continue one in progress.
+    """
+    total_chips = starting_stack * field_size
+    big_blind = first_big_blind or max(2, nice_chips(starting_stack / starting_depth))
+    structure: List[BlindLevel] = []
+    played = 0
+    while played < max_levels:
+        played += 1
+        ante = nice_chips(big_blind * ante_fraction) if played >= ante_from_level else 0
+        level = BlindLevel(big_blind // 2, big_blind, ante, level_minutes)
+        structure.append(level)
+        if big_blind * 8 >= total_chips:
+            break
+        if break_every and played % break_every == 0:
+            structure.append(BlindLevel(level.small_blind, level.big_blind, level.ante,
+                                        break_minutes, is_break=True))
+        next_blind = nice_chips(big_blind * growth)
+        if next_blind <= big_blind:
+            next_blind = nice_chips(big_blind * growth * 1.2)
+        big_blind = next_blind
+    return structure
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    if mean < 30:
+        # Knuth's multiplication method is fine for small means
+        limit = math.exp(-mean)
+        count, product = 0, rng.random()
+        while product > limit:
+            count += 1
+            product *= rng.random()
+        return count
+    return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+
+def simulate_finish(structure: Sequence[BlindLevel], field_size: int, starting_stack: int,
+                    model: FinishModel, rng: random.Random) -> float:
+    """Minutes until one player is left in one simulated run of the event"""
+    total_chips = starting_stack * field_size
+    remaining = field_size
+    elapsed = 0.0
+    playing = [level for level in structure if not level.is_break]
+    index = 0
+    while elapsed < model.max_minutes:
+        if index < len(structure):
+            level = structure[index]
+            index += 1
+            if level.is_break:
+                elapsed += level.duration_minutes
+                continue
+            minutes_left = float(level.duration_minutes)
+        else:
+            # Past the end of the schedule the last level plays on
+            level = playing[-1]
+            minutes_left = model.max_minutes - elapsed
+        while minutes_left > 0:
+            step = min(model.step_minutes, minutes_left)
+            tables = -(-remaining // model.table_size)
+            orbit = level.small_blind + level.big_blind + level.ante * min(model.table_size, remaining)
+            m_ratio = total_chips / remaining / orbit
+            hands = step / 60 * model.hands_per_hour
+            busts = _poisson(rng, tables * hands * model.bust_rate / m_ratio)
+            if busts >= remaining - 1:
+                return elapsed + step * (remaining - 1) / busts
+            remaining -= busts
+            elapsed += step
+            minutes_left -= step
+    return model.max_minutes
+
+def _evaluate(task) -> Tuple[int, List[float]]:
+    index, structure, field_size, starting_stack, model, trials, seed = task
+    rng = random.Random(seed * 1_000_003 + index)
+    finishes = [simulate_finish(structure, field_size, starting_stack, model, rng) for _ in range(trials)]
+    finishes.sort()
+    return index, finishes
+
+def _rmse(finishes: Sequence[float], target: float) -> float:
+    return math.sqrt(sum((t - target) ** 2 for t in finishes) / len(finishes))
+
+def plan_blind_structure(starting_stack: int, field_size: int, target_minutes: float,
+                         break_every: int = 4, break_minutes: int = 15,
+                         level_minutes: Sequence[int] = (15, 20, 25, 30, 40, 60),
+                         growths: Sequence[float] = (1.25, 1.33, 1.4, 1.5, 1.6),
+                         starting_depths: Sequence[int] = (100, 150, 200, 300),
+                         trials: int = 300, seed: int = 0,
+                         model: Optional[FinishModel] = None,
+                         max_workers: Optional[int] = None,
+                         ante_from_level: int = 4,
+                         first_big_blind: Optional[int] = None) -> BlindPlan:
+    """Pick the blind structure whose simulated finish times best match the target.
+
+    Every combination of level length, blind growth and starting depth is
+    built with ``build_structure`` and simulated through the finish model
+    on a process pool (``max_workers=1`` runs in-process). All candidates
+    are screened with a few runs and the best quarter get ``trials`` runs
+    each; the one with the smallest root mean squared error against
+    ``target_minutes`` wins, so both bias and spread count. Results are
+    reproducible for a given seed. ``ante_from_level`` and
+    ``first_big_blind`` are passed on to ``build_structure``.
+    """
+    if field_size < 2:
+        raise ValueError("A tournament needs at least two players")
+    model = model or FinishModel()
+    candidates = [(minutes, growth, depth)
+                  for minutes in level_minutes for growth in growths for depth in starting_depths]
+    structures = [build_structure(starting_stack, field_size, minutes, growth, depth,
+                                  break_every, break_minutes, ante_from_level,
+                                  first_big_blind=first_big_blind)
+                  for minutes, growth, depth in candidates]
+
+    def run(indexes: Sequence[int], trial_count: int) -> List[Tuple[float, int, List[float]]]:
+        tasks = [(i, structures[i], field_size, starting_stack, model, trial_count, seed) for i in indexes]
+        if pool is None:
+            results = map(_evaluate, tasks)
+        else:
+            results = pool.map(_evaluate, tasks, chunksize=max(1, len(tasks) // (4 * workers)))
+        scored = [(_rmse(finishes, target_minutes), i, finishes) for i, finishes in results]
+        scored.sort(key=lambda item: item[:2])
+        return scored
+
+    # Screen every candidate with a few runs, then spend the full trial
+    # budget only on the most promising quarter
+    workers = max_workers or os.cpu_count() or 1
+    pool = None if workers == 1 else ProcessPoolExecutor(workers)
+    try:
+        screening = run(range(len(candidates)), max(20, trials // 8))
+        finalists = [i for _, i, _ in screening[:max(4, len(candidates) // 4)]]
+        best = run(finalists, trials)[0]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    rmse, index, finishes = best
+    minutes, growth, depth = candidates[index]
+    return BlindPlan(
+        structure=structures[index],
+        level_minutes=minutes,
+        growth=growth,
+        starting_depth=depth,
+        mean_minutes=sum(finishes) / len(finishes),
+        p10_minutes=finishes[int(0.1 * len(finishes))],
+        p50_minutes=finishes[len(finishes) // 2],
+        p90_minutes=finishes[min(int(0.9 * len(finishes)), len(finishes) - 1)],
+        rmse_minutes=rmse,
+        candidates=len(candidates),
+        finish_minutes=finishes,
+    )
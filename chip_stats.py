@@ -0,0 +1,173 @@
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from tournament_types import BlindLevel
+
+@dataclass
+class ChipStats:
+    total_chips: int
+    players: int
+    average_stack: float
+    big_blinds: Optional[float]  # average stack in big blinds; None without blinds
+    m_ratio: Optional[float]  # average stack over one orbit of blinds and antes
+
+def chip_stats(total_chips: int, players: int, level: BlindLevel, table_size: int = 9) -> ChipStats:
+    """Aggregate stack figures against ``level``'s blinds"""
+    average = total_chips / players if players else 0.0
+    big_blinds = m_ratio = None
+    if level.big_blind > 0:
+        big_blinds = average / level.big_blind
+        orbit = level.small_blind + level.big_blind + level.ante * min(table_size, players)
+        m_ratio = average / orbit
+    return ChipStats(total_chips, players, average, big_blinds, m_ratio)
+
+class _BucketSizes:
+    """Fenwick tree over bucket lengths, for O(log buckets) prefix counts"""
+
+    __slots__ = ('_tree',)
+
+    def __init__(self, sizes: Iterable[int]):
+        tree = [0]
+        tree.extend(sizes)
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def add(self, index: int, amount: int) -> None:
+        tree = self._tree
+        index += 1
+        while index < len(tree):
+            tree[index] += amount
+            index += index & -index
+
+    def before(self, index: int) -> int:
+        """Number of entries in the buckets ahead of ``index``"""
+        tree = self._tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+class ChipLeaderboard:
+    """Chip counts of players still in, with running totals and an ordered index.
+
+    Stacks are kept sorted biggest first (ties by player ID) in a list of
+    small sorted buckets, with a Fenwick tree over the bucket lengths. An
+    update is a bisect in one bucket plus an O(log n) tree update, the
+    rank of a player is an O(log n) prefix count, and the top N are read
+    straight off the front, so nothing ever re-sorts the field.
+    """
+
+    BUCKET_SIZE = 256
+
+    def __init__(self):
+        self._chips: Dict[int, int] = {}
+        self._buckets: List[List[Tuple[int, int]]] = []
+        self._lasts: List[Tuple[int, int]] = []  # last key of every bucket
+        self._sizes = _BucketSizes(())
+        self.total_chips = 0
+
+    def __len__(self) -> int:
+        return len(self._chips)
+
+    def __contains__(self, player_id) -> bool:
+        return player_id in self._chips
+
+    def get(self, player_id: int, default: Optional[int] = None) -> Optional[int]:
+        return self._chips.get(player_id, default)
+
+    def items(self):
+        return self._chips.items()
+
+    def rebuild(self, counts: Iterable[Tuple[int, int]]) -> None:
+        """Replace every stack at once in O(n log n)"""
+        self._chips = dict(counts)
+        self.total_chips = sum(self._chips.values())
+        keys = sorted((-chips, player_id) for player_id, chips in self._chips.items())
+        size = self.BUCKET_SIZE
+        self._buckets = [keys[i:i + size] for i in range(0, len(keys), size)]
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._lasts = [bucket[-1] for bucket in self._buckets]
+        self._sizes = _BucketSizes(len(bucket) for bucket in self._buckets)
+
+    def _insert(self, key: Tuple[int, int]) -> None:
+        buckets = self._buckets
+        if not buckets:
+            buckets.append([key])
+            self._reindex()
+            return
+        index = min(bisect_left(self._lasts, key), len(buckets) - 1)
+        bucket = buckets[index]
+        insort(bucket, key)
+        self._lasts[index] = bucket[-1]
+        if len(bucket) > 2 * self.BUCKET_SIZE:
+            half = len(bucket) // 2
+            buckets[index:index + 1] = [bucket[:half], bucket[half:]]
+            self._reindex()
+        else:
+            self._sizes.add(index, 1)
+
+    def _remove(self, key: Tuple[int, int]) -> None:
+        index = bisect_left(self._lasts, key)
+        bucket = self._buckets[index]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self._lasts[index] = bucket[-1]
+            self._sizes.add(index, -1)
+        else:
+            del self._buckets[index]
+            self._reindex()
+
+    def set(self, player_id: int, chips: int) -> None:
+        """Set a player's stack, adding them to the index if needed"""
+        if chips < 0:
+            raise ValueError("Chip counts cannot be negative")
+        old = self._chips.get(player_id)
+        if old == chips:
+            return
+        if old is not None:
+            self._remove((-old, player_id))
+            self.total_chips -= old
+        self._insert((-chips, player_id))
+        self._chips[player_id] = chips
+        self.total_chips += chips
+
+    def set_many(self, counts: Dict[int, int]) -> None:
+        """Set several stacks, re-sorting once instead when that is cheaper"""
+        if len(counts) <= len(self._chips) // 4:
+            for player_id, chips in counts.items():
+                self.set(player_id, chips)
+            return
+        if any(chips < 0 for chips in counts.values()):
+            raise ValueError("Chip counts cannot be negative")
+        merged = dict(self._chips)
+        merged.update(counts)
+        self.rebuild(merged.items())
+
+    def remove(self, player_id: int) -> int:
+        """Take a player out of the index, returning the chips they had"""
+        chips = self._chips.pop(player_id)
+        self._remove((-chips, player_id))
+        self.total_chips -= chips
+        return chips
+
+    def top(self, count: int) -> List[Tuple[int, int]]:
+        """(player ID, chips) for the ``count`` biggest stacks, biggest first"""
+        leaders: List[Tuple[int, int]] = []
+        for bucket in self._buckets:
+            for chips, player_id in bucket:
+                if len(leaders) == count:
+                    return leaders
+                leaders.append((player_id, -chips))
+        return leaders
+
+    def rank(self, player_id: int) -> int:
+        """1-based chip position of a player (1 = chip leader)"""
+        key = (-self._chips[player_id], player_id)
+        index = bisect_left(self._lasts, key)
+        return self._sizes.before(index) + bisect_left(self._buckets[index], key) + 1
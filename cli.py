@@ -0,0 +1,151 @@
+import argparse
+import json
+import subprocess
+import sys
+import time
+from decimal import Decimal
+from typing import List, Optional
+
+# Modules a headless process may import without pulling in Qt
+HEADLESS_MODULES = ['service', 'cli']
+
+def cmd_payouts(args) -> int:
+    from service import TournamentService
+    service = TournamentService.create(args.type, Decimal(args.buy_in), args.bounty)
+    service.register(f"Player {i}" for i in range(1, args.entries + 1))
+    for place, prize in service.payouts():
+        print(f"{place:>6}  {prize:>14,}")
+    return 0
+
+def cmd_status(args) -> int:
+    from service import TournamentService
+    service = TournamentService.create(args.type, Decimal(args.buy_in), args.bounty,
+                                       journal_path=args.journal, starting_stack=args.stack,
+                                       late_registration_levels=args.late_reg)
+    print(json.dumps(service.status(), indent=2))
+    service.close()
+    return 0
+
+def cmd_register(args) -> int:
+    from service import TournamentService
+    service = TournamentService.create(args.type, Decimal(args.buy_in), args.bounty,
+                                       journal_path=args.journal, starting_stack=args.stack,
+                                       late_registration_levels=args.late_reg)
+    start = time.perf_counter()
+    ids = service.import_registrations(args.file, args.format)
+    elapsed = time.perf_counter() - start
+    print(f"Registered {len(ids):,} entries in {elapsed * 1000:.0f} ms "
+          f"({len(service.manager.players):,} total)")
+    service.close()
+    return 0
+
+def cmd_plan(args) -> int:
+    from blind_planner import plan_blind_structure
+    start = time.perf_counter()
+    plan = plan_blind_structure(args.stack, args.entries, args.hours * 60,
+                                break_every=args.break_every, break_minutes=args.break_minutes,
+                                trials=args.trials, seed=args.seed, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{plan.level_minutes}-minute levels, x{plan.growth} growth, {plan.starting_depth} BB deep "
+          f"(best of {plan.candidates} candidates in {elapsed:.1f} s)")
+    print(f"Predicted finish: median {plan.p50_minutes / 60:.1f} h, "
+          f"80% between {plan.p10_minutes / 60:.1f} and {plan.p90_minutes / 60:.1f} h")
+    number = 0
+    for level in plan.structure:
+        if level.is_break:
+            print(f"{'':>5}  BREAK {level.duration_minutes} min")
+        else:
+            number += 1
+            print(f"{number:>5}  {level.small_blind:>9,}/{level.big_blind:<9,} ante {level.ante:<7,} "
+                  f"{level.duration_minutes} min")
+    return 0
+
+def cmd_check_imports(args) -> int:
+    """Import the headless modules in a fresh interpreter and enforce the time budget"""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"for name in {HEADLESS_MODULES!r}: __import__(name)\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "qt = sorted(m for m in sys.modules if m.startswith('PyQt'))\n"
+        "print(f'{elapsed:.1f} {\",\".join(qt)}')\n"
+    )
+    best = None
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout.split()
+        elapsed = float(output[0])
+        best = elapsed if best is None else min(best, elapsed)
+        if len(output) > 1:
+            print(f"FAIL: headless import loaded {output[1]}")
+            return 1
+    if best > args.budget_ms:
+        print(f"FAIL: headless import took {best:.1f} ms (budget {args.budget_ms} ms)")
+        return 1
+    print(f"OK: headless import took {best:.1f} ms (budget {args.budget_ms} ms), no Qt loaded")
+    return 0
+
+def cmd_gui(args) -> int:
+    import main
+    main.main()
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Headless tournament manager")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_tournament_args(command):
+        command.add_argument('--type', default='regular', choices=['regular', 'pko'])
+        command.add_argument('--buy-in', default='100')
+        command.add_argument('--bounty', default=None)
+        command.add_argument('--stack', type=int, default=0, help="starting stack in chips")
+        command.add_argument('--late-reg', type=int, default=None,
+                             help="levels after which registration closes")
+
+    payouts = commands.add_parser('payouts', help="print the payout board for a field size")
+    add_tournament_args(payouts)
+    payouts.add_argument('--entries', type=int, required=True)
+    payouts.set_defaults(func=cmd_payouts)
+
+    status = commands.add_parser('status', help="restore a tournament from its journal and print its status")
+    add_tournament_args(status)
+    status.add_argument('--journal', required=True)
+    status.set_defaults(func=cmd_status)
+
+    register = commands.add_parser('register', help="import a CSV or JSONL pre-registration file into a journal")
+    add_tournament_args(register)
+    register.add_argument('--journal', required=True)
+    register.add_argument('--file', required=True)
+    register.add_argument('--format', choices=['csv', 'jsonl'], default=None)
+    register.set_defaults(func=cmd_register)
+
+    plan = commands.add_parser('plan', help="plan a blind structure for a field size and target duration")
+    plan.add_argument('--stack', type=int, required=True)
+    plan.add_argument('--entries', type=int, required=True)
+    plan.add_argument('--hours', type=float, required=True)
+    plan.add_argument('--break-every', type=int, default=4)
+    plan.add_argument('--break-minutes', type=int, default=15)
+    plan.add_argument('--trials', type=int, default=300)
+    plan.add_argument('--seed', type=int, default=0)
+    plan.add_argument('--workers', type=int, default=None)
+    plan.set_defaults(func=cmd_plan)
+
+    check = commands.add_parser('check-imports', help="check the headless import-time budget")
+    check.add_argument('--budget-ms', type=float, default=150.0)
+    check.add_argument('--runs', type=int, default=3)
+    check.set_defaults(func=cmd_check_imports)
+
+    gui = commands.add_parser('gui', help="launch the admin and display windows")
+    gui.set_defaults(func=cmd_gui)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        parser.exit(2, f"{parser.prog}: error: {e}\n")
+
+if __name__ == '__main__':
+    sys.exit(main())
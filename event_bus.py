@@ -0,0 +1,91 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+class ChangeType(Enum):
+    LEVEL_CHANGED = "level_changed"
+    HAND_FOR_HAND_CHANGED = "hand_for_hand_changed"
+    PLAYER_ADDED = "player_added"
+    PLAYER_ELIMINATED = "player_eliminated"
+    PLAYER_REMOVED = "player_removed"  # entry withdrawn and refunded
+    PLAYERS_REMAINING_CHANGED = "players_remaining_changed"
+    BOUNTY_UPDATED = "bounty_updated"
+    PRIZE_POOL_CHANGED = "prize_pool_changed"
+    CLOCK_CHANGED = "clock_changed"  # started, paused or adjusted
+    SEATS_CHANGED = "seats_changed"  # value: list of SeatMove
+    CHIPS_CHANGED = "chips_changed"  # value: total chips in play
+
+@dataclass(slots=True)
+class ChangeEvent:
+    type: ChangeType
+    key: Optional[Hashable]  # e.g. the player ID for per-player changes
+    value: Any
+
+Listener = Callable[[ChangeEvent], None]
+
+class EventBus:
+    """Publishes fine-grained change notifications with coalescing.
+
+    Inside ``batch()`` events are held back and only the latest value per
+    (type, key) is delivered when the outermost batch ends, so a burst of
+    changes produces one notification per thing that changed. Listeners
+    are called on the emitting thread.
+    """
+
+    def __init__(self):
+        self._listeners: Dict[ChangeType, List[Listener]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def subscribe(self, change_type: ChangeType, listener: Listener) -> None:
+        with self._lock:
+            listeners = list(self._listeners.get(change_type, ()))
+            listeners.append(listener)
+            self._listeners[change_type] = listeners
+
+    def unsubscribe(self, change_type: ChangeType, listener: Listener) -> None:
+        with self._lock:
+            listeners = [l for l in self._listeners.get(change_type, ()) if l != listener]
+            if listeners:
+                self._listeners[change_type] = listeners
+            else:
+                self._listeners.pop(change_type, None)
+
+    def has_listeners(self) -> bool:
+        return bool(self._listeners)
+
+    def wants(self, change_type: ChangeType) -> bool:
+        return change_type in self._listeners
+
+    @contextmanager
+    def batch(self):
+        """Coalesce every event emitted on this thread until the block ends"""
+        local = self._local
+        pending = getattr(local, 'pending', None)
+        if pending is not None:
+            yield
+            return
+        local.pending = pending = {}
+        try:
+            yield
+        finally:
+            local.pending = None
+            for event in pending.values():
+                self._deliver(event)
+
+    def emit(self, change_type: ChangeType, value: Any = None, key: Optional[Hashable] = None) -> None:
+        if change_type not in self._listeners:
+            return
+        event = ChangeEvent(change_type, key, value)
+        pending: Optional[Dict[Tuple[ChangeType, Hashable], ChangeEvent]] = getattr(self._local, 'pending', None)
+        if pending is None:
+            self._deliver(event)
+        else:
+            pending.pop((change_type, key), None)  # move to the end: latest order wins
+            pending[(change_type, key)] = event
+
+    def _deliver(self, event: ChangeEvent) -> None:
+        for listener in self._listeners.get(event.type, ()):
+            listener(event)
@@ -0,0 +1,303 @@
+import os
+import struct
+import zlib
+from typing import List, Optional
+from money import to_decimal
+from tournament_types import BlindLevel, Player, TournamentType
+
+# Journal operations. Each records the *effect* of a manager call rather than
+# its inputs, so replay only assigns fields and never re-runs bounty math.
+OP_ADD_PLAYER = 1   # player_id, bounty_cents (-1 = none), name
+OP_ELIMINATE = 2    # player_id, position
+OP_BOUNTY = 3       # player_id, new bounty_cents, new bounty_won_cents
+OP_LEVEL = 4        # level index
+OP_HAND_FOR_HAND = 5  # 0/1
+OP_PRIZE_POOL = 6   # new prize pool in cents
+OP_CHIPS = 7        # player_id, new chip count
+OP_REMOVE_PLAYER = 8  # player_id (entry withdrawn and refunded)
+OP_CONFIG = 9       # tournament type, buy-in, bounty (-1 = none), starting stack, late reg (-1 = none)
+OP_BLIND_STRUCTURE = 10  # tuple of BlindLevel
+OP_REENTER = 11     # player_id of the busted entry that was bought back in
+
+_OP = struct.Struct('<B')
+_ADD = struct.Struct('<IqH')
+_ELIMINATE = struct.Struct('<II')
+_BOUNTY = struct.Struct('<Iqq')
+_CHIPS = struct.Struct('<Iq')
+_UINT = struct.Struct('<I')
+_FLAG = struct.Struct('<B')
+_CENTS = struct.Struct('<q')
+_CONFIG = struct.Struct('<qqqiH')  # buy-in, bounty, starting stack, late reg levels, type name len
+_LEVEL = struct.Struct('<IIIIB')  # small blind, big blind, ante, minutes, is_break
+_COUNT = struct.Struct('<H')
+_FRAME = struct.Struct('<II')  # payload length, crc32
+
+_SNAPSHOT_MAGIC = b'TMSNAP01'
+_SNAPSHOT_HEADER = struct.Struct('<QIBqII')  # offset, level, hfh, pool, next_id, count
+_SNAPSHOT_PLAYER = struct.Struct('<IqqBIqH')  # id, bounty, won, flags, position, chips, name len
+_ELIMINATED_FLAG = 1
+_REENTERED_FLAG = 2
+
+# Money is stored as integer cents; -1 stands in for "no bounty".
+def _pack_cents(cents: Optional[int]) -> int:
+    return -1 if cents is None else cents
+
+def _unpack_cents(cents: int) -> Optional[int]:
+    return None if cents < 0 else cents
+
+def _encode(events) -> bytes:
+    parts = []
+    for event in events:
+        op = event[0]
+        parts.append(_OP.pack(op))
+        if op == OP_ADD_PLAYER:
+            name = event[3].encode('utf-8')
+            parts.append(_ADD.pack(event[1], _pack_cents(event[2]), len(name)))
+            parts.append(name)
+        elif op == OP_ELIMINATE:
+            parts.append(_ELIMINATE.pack(event[1], event[2]))
+        elif op == OP_BOUNTY:
+            parts.append(_BOUNTY.pack(event[1], _pack_cents(event[2]), event[3]))
+        elif op == OP_LEVEL:
+            parts.append(_UINT.pack(event[1]))
+        elif op == OP_HAND_FOR_HAND:
+            parts.append(_FLAG.pack(1 if event[1] else 0))
+        elif op == OP_PRIZE_POOL:
+            parts.append(_CENTS.pack(event[1]))
+        elif op == OP_CHIPS:
+            parts.append(_CHIPS.pack(event[1], event[2]))
+        elif op in (OP_REMOVE_PLAYER, OP_REENTER):
+            parts.append(_UINT.pack(event[1]))
+        elif op == OP_CONFIG:
+            name = event[1].encode('utf-8')
+            parts.append(_CONFIG.pack(event[2], _pack_cents(event[3]), event[4],
+                                      -1 if event[5] is None else event[5], len(name)))
+            parts.append(name)
+        elif op == OP_BLIND_STRUCTURE:
+            parts.append(_COUNT.pack(len(event[1])))
+            parts.extend(_LEVEL.pack(level.small_blind, level.big_blind, level.ante,
+                                     level.duration_minutes, 1 if level.is_break else 0)
+                         for level in event[1])
+        else:
+            raise ValueError(f"Unknown journal operation {op}")
+    return b''.join(parts)
+
+def config_events(manager) -> List[tuple]:
+    """The manager's configuration as journal events"""
+    return [(OP_CONFIG, manager.tournament_type.name, manager._buy_in_cents, manager._bounty_cents,
+             manager.starting_stack, manager.late_registration_levels),
+            (OP_BLIND_STRUCTURE, tuple(manager.blind_structure))]
+
+def _apply(manager, data: bytes, start: int, end: int) -> None:
+    """Replay the encoded events in ``data[start:end]`` onto ``manager``"""
+    players = manager.players
+    while start < end:
+        op = data[start]
+        start += 1
+        if op == OP_ELIMINATE:
+            player_id, position = _ELIMINATE.unpack_from(data, start)
+            start += _ELIMINATE.size
+            players.eliminate(player_id, position)
+        elif op == OP_BOUNTY:
+            player_id, bounty, won = _BOUNTY.unpack_from(data, start)
+            start += _BOUNTY.size
+            player = players[player_id]
+            player.bounty_cents = _unpack_cents(bounty)
+            player.bounty_won_cents = won
+        elif op == OP_ADD_PLAYER:
+            player_id, bounty, name_len = _ADD.unpack_from(data, start)
+            start += _ADD.size
+            name = data[start:start + name_len].decode('utf-8')
+            start += name_len
+            players.restore([Player(id=player_id, name=name, bounty_cents=_unpack_cents(bounty))])
+        elif op == OP_CHIPS:
+            player_id, chips = _CHIPS.unpack_from(data, start)
+            start += _CHIPS.size
+            players[player_id].chips = chips
+        elif op == OP_REMOVE_PLAYER:
+            players.remove(_UINT.unpack_from(data, start)[0])
+            start += _UINT.size
+        elif op == OP_REENTER:
+            players[_UINT.unpack_from(data, start)[0]].reentered = True
+            start += _UINT.size
+        elif op == OP_PRIZE_POOL:
+            manager.prize_pool_cents = _CENTS.unpack_from(data, start)[0]
+            start += _CENTS.size
+        elif op == OP_LEVEL:
+            manager.current_level = _UINT.unpack_from(data, start)[0]
+            start += _UINT.size
+        elif op == OP_HAND_FOR_HAND:
+            manager.hand_for_hand = bool(data[start])
+            start += _FLAG.size
+        elif op == OP_CONFIG:
+            buy_in, bounty, stack, late_registration, name_len = _CONFIG.unpack_from(data, start)
+            start += _CONFIG.size
+            manager.tournament_type = TournamentType[data[start:start + name_len].decode('utf-8')]
+            start += name_len
+            bounty = _unpack_cents(bounty)
+            manager.buy_in = to_decimal(buy_in)
+            manager.bounty_amount = None if bounty is None else to_decimal(bounty)
+            manager.starting_stack = stack
+            manager.late_registration_levels = None if late_registration < 0 else late_registration
+        elif op == OP_BLIND_STRUCTURE:
+            count = _COUNT.unpack_from(data, start)[0]
+            start += _COUNT.size
+            levels = []
+            for _ in range(count):
+                small_blind, big_blind, ante, minutes, is_break = _LEVEL.unpack_from(data, start)
+                start += _LEVEL.size
+                levels.append(BlindLevel(small_blind, big_blind, ante, minutes, bool(is_break)))
+            manager.blind_structure = levels
+        else:
+            raise ValueError(f"Unknown journal operation {op}")
+
+def _frame(payload: bytes) -> bytes:
+    # Header and payload go out in one write so a frame is never split
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+class EventJournal:
+    """Append-only binary event log with periodic snapshots.
+
+    Every manager operation is written as one CRC-checked frame, so a crash
+    part-way through a write loses at most that operation. Every
+    ``snapshot_interval`` frames the full state is written to a compact
+    snapshot and a restart only has to replay the frames written after it.
+
+    The tournament's configuration (type, buy-in, bounty, starting stack,
+    late registration and blind structure) opens every journal and every
+    snapshot, and restoring applies it, so a journal always comes back as
+    the event it was written for.
+    """
+
+    def __init__(self, path: str, snapshot_path: Optional[str] = None,
+                 snapshot_interval: int = 1000, fsync: bool = False):
+        self.path = path
+        self.snapshot_path = snapshot_path or path + '.snapshot'
+        self.snapshot_interval = snapshot_interval
+        self.fsync = fsync
+        self._file = None
+        self._frames_since_snapshot = 0
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+        return self._file
+
+    def append(self, manager, events) -> None:
+        """Write one operation's events as a single frame"""
+        f = self._open()
+        if f.tell() == 0:
+            # A new journal starts with the configuration it belongs to
+            f.write(_frame(_encode(config_events(manager))))
+        f.write(_frame(_encode(events)))
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+        self._frames_since_snapshot += 1
+        if self.snapshot_interval and self._frames_since_snapshot >= self.snapshot_interval:
+            self.snapshot(manager)
+
+    def snapshot(self, manager) -> None:
+        """Write the manager's full state, tagged with the current journal offset"""
+        f = self._open()
+        f.flush()
+        offset = f.tell()
+        players = manager.players.values()
+        parts = [_SNAPSHOT_MAGIC, _SNAPSHOT_HEADER.pack(
+            offset, manager.current_level, 1 if manager.hand_for_hand else 0,
+            manager.prize_pool_cents, manager.players.next_id, len(players))]
+        config = _encode(config_events(manager))
+        parts.append(_UINT.pack(len(config)))
+        parts.append(config)
+        for player in players:
+            name = player.name.encode('utf-8')
+            parts.append(_SNAPSHOT_PLAYER.pack(
+                player.id, _pack_cents(player.bounty_cents), player.bounty_won_cents,
+                (_ELIMINATED_FLAG if player.eliminated else 0) | (_REENTERED_FLAG if player.reentered else 0),
+                player.position or 0, player.chips, len(name)))
+            parts.append(name)
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'wb') as snap:
+            snap.write(b''.join(parts))
+            snap.flush()
+            if self.fsync:
+                os.fsync(snap.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._frames_since_snapshot = 0
+
+    def _load_snapshot(self, manager) -> int:
+        try:
+            with open(self.snapshot_path, 'rb') as snap:
+                data = snap.read()
+        except FileNotFoundError:
+            # The whole journal is replayed, onto an empty tournament
+            manager.players.clear()
+            manager.prize_pool_cents = 0
+            manager.current_level = 0
+            manager.hand_for_hand = False
+            return 0
+        if not data.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError(f"{self.snapshot_path} is not a tournament snapshot")
+        pos = len(_SNAPSHOT_MAGIC)
+        offset, level, hfh, pool, next_id, count = _SNAPSHOT_HEADER.unpack_from(data, pos)
+        pos += _SNAPSHOT_HEADER.size
+        length = _UINT.unpack_from(data, pos)[0]
+        pos += _UINT.size
+        _apply(manager, data, pos, pos + length)
+        pos += length
+        players: List[Player] = []
+        for _ in range(count):
+            player_id, bounty, won, flags, position, chips, name_len = _SNAPSHOT_PLAYER.unpack_from(data, pos)
+            pos += _SNAPSHOT_PLAYER.size
+            name = data[pos:pos + name_len].decode('utf-8')
+            pos += name_len
+            players.append(Player(id=player_id, name=name, bounty_cents=_unpack_cents(bounty),
+                                  eliminated=bool(flags & _ELIMINATED_FLAG), position=position or None,
+                                  bounty_won_cents=won, chips=chips,
+                                  reentered=bool(flags & _REENTERED_FLAG)))
+        manager.players.clear()
+        manager.players.restore(players, next_id)
+        manager.current_level = level
+        manager.hand_for_hand = bool(hfh)
+        manager.prize_pool_cents = pool
+        return offset
+
+    def restore(self, manager) -> int:
+        """Load the latest snapshot into ``manager`` and replay the journal tail.
+
+        A torn frame at the end of the journal (from a crash mid-write) is
+        truncated away. Returns the number of frames replayed.
+        """
+        self.close()
+        offset = self._load_snapshot(manager)
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        view = memoryview(data)
+        pos = 0
+        frames = 0
+        while pos + _FRAME.size <= len(data):
+            length, crc = _FRAME.unpack_from(data, pos)
+            start = pos + _FRAME.size
+            end = start + length
+            if end > len(data) or zlib.crc32(view[start:end]) != crc:
+                break
+            try:
+                _apply(manager, data, start, end)
+            except ValueError as e:
+                raise ValueError(f"{e} in the frame at offset {offset + pos}") from None
+            pos = end
+            frames += 1
+        if pos < len(data):
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset + pos)
+        self._frames_since_snapshot = frames
+        return frames
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence
+from money import Cents, to_decimal
+from tournament_types import TournamentType
+
+# Tables up to this size use the exact engine by default
+EXACT_LIMIT = 10
+
+@dataclass
+class DealEquity:
+    player_id: int
+    chips: int
+    icm_equity: Decimal
+    bounty_equity: Decimal
+    total: Decimal
+
+def _share_bottom_places(stacks: Sequence[int], payouts: Sequence[float],
+                         equities: List[float]) -> List[float]:
+    # Players without chips finish below everyone with chips and split
+    # the places left after them equally
+    busted = [i for i in range(len(stacks)) if stacks[i] <= 0]
+    if busted:
+        share = sum(payouts[len(stacks) - len(busted):len(stacks)]) / len(busted)
+        for i in busted:
+            equities[i] = share
+    return equities
+
+def icm_exact(stacks: Sequence[int], payouts: Sequence[float]) -> List[float]:
+    """Exact Malmuth-Harville equities.
+
+    Instead of enumerating every finishing order, probabilities are
+    memoized per set of already-placed players, one layer per paid place,
+    so a full ten-handed table needs about 10 * 2**10 steps rather than
+    10! orderings. Players without chips share the bottom places.
+    """
+    n = len(stacks)
+    equities = [0.0] * n
+    live = [i for i in range(n) if stacks[i] > 0]
+    paid = min(len(payouts), len(live))
+    total = sum(stacks[i] for i in live)
+    if paid == 0:
+        return _share_bottom_places(stacks, payouts, equities)
+    layer: Dict[int, float] = {0: 1.0}
+    placed_chips: Dict[int, int] = {0: 0}
+    for place in range(paid):
+        prize = payouts[place]
+        last = place + 1 == paid
+        next_layer: Dict[int, float] = {}
+        for mask, probability in layer.items():
+            remaining = total - placed_chips[mask]
+            if remaining <= 0:
+                continue
+            scale = probability / remaining
+            for i in live:
+                bit = 1 << i
+                if mask & bit:
+                    continue
+                p = scale * stacks[i]
+                equities[i] += p * prize
+                if not last:
+                    child = mask | bit
+                    if child in next_layer:
+                        next_layer[child] += p
+                    else:
+                        next_layer[child] = p
+                        placed_chips[child] = placed_chips[mask] + stacks[i]
+        layer = next_layer
+    return _share_bottom_places(stacks, payouts, equities)
+
+def icm_monte_carlo(stacks: Sequence[int], payouts: Sequence[float],
+                    trials: int = 100_000, seed: Optional[int] = None,
+                    batch_size: int = 50_000) -> List[float]:
+    """Sampled Malmuth-Harville equities, vectorized with NumPy.
+
+    Harville finishing orders are drawn by giving every player an
+    exponential "bust time" with rate equal to their stack; sorting the
+    times gives an order with exactly the Harville probabilities. Players
+    without chips share the bottom places.
+    """
+    import numpy as np
+
+    live = [i for i in range(len(stacks)) if stacks[i] > 0]
+    n = len(live)
+    paid = min(len(payouts), n)
+    equities = [0.0] * len(stacks)
+    if paid == 0:
+        return _share_bottom_places(stacks, payouts, equities)
+    rng = np.random.default_rng(seed)
+    rates = np.asarray([stacks[i] for i in live], dtype=np.float64)
+    prizes = np.asarray(payouts[:paid], dtype=np.float64)
+    totals = np.zeros(n)
+    done = 0
+    while done < trials:
+        size = min(batch_size, trials - done)
+        times = rng.standard_exponential((size, n)) / rates
+        if paid < n:
+            # Only the paid places need ordering
+            order = np.argpartition(times, paid - 1, axis=1)[:, :paid]
+            ranked = np.take_along_axis(times, order, axis=1).argsort(axis=1)
+            order = np.take_along_axis(order, ranked, axis=1)
+        else:
+            order = times.argsort(axis=1)
+        totals += np.bincount(order.ravel(), weights=np.tile(prizes, size), minlength=n)
+        done += size
+    for i, total in zip(live, (totals / trials).tolist()):
+        equities[i] = total
+    return _share_bottom_places(stacks, payouts, equities)
+
+def icm_equities(stacks: Sequence[int], payouts: Sequence[float],
+                 method: str = 'auto', **kwargs) -> List[float]:
+    """ICM equities with the exact engine for small tables and sampling above.
+
+    ``method`` is ``'exact'``, ``'monte_carlo'`` or ``'auto'``.
+    """
+    if method == 'auto':
+        method = 'exact' if len(stacks) <= EXACT_LIMIT else 'monte_carlo'
+    if method == 'exact':
+        return icm_exact(stacks, payouts)
+    if method == 'monte_carlo':
+        return icm_monte_carlo(stacks, payouts, **kwargs)
+    raise ValueError(f"Unknown ICM method {method!r}")
+
+def _round_to_total(values: Sequence[float], total: Cents) -> List[Cents]:
+    """Round to cents so the result sums exactly to ``total``"""
+    floors = [int(v) for v in values]
+    by_remainder = sorted(range(len(values)), key=lambda i: (floors[i] - values[i], i))
+    for i in by_remainder[:max(total - sum(floors), 0)]:
+        floors[i] += 1
+    if sum(floors) != total:
+        raise ValueError(f"Values sum to {sum(floors)} cents after rounding, expected {total}")
+    return floors
+
+def calculate_deal(manager, chip_counts: Optional[Dict[int, int]] = None,
+                   method: str = 'auto', **kwargs) -> Dict[int, DealEquity]:
+    """ICM deal for the players in ``chip_counts`` (player id -> chips).
+
+    Without ``chip_counts`` the stacks the manager tracks for every player
+    still in are used; players with no chips share the bottom places. The
+    prizes still to be paid come from the manager's active payout structure. In PKO events each player also gets a bounty
+    equity: the bounties left in play, shared in proportion to chips.
+    """
+    if chip_counts is None:
+        chip_counts = dict(manager.chips.items())
+    player_ids = list(chip_counts)
+    stacks = [chip_counts[player_id] for player_id in player_ids]
+    if any(chips < 0 for chips in stacks):
+        raise ValueError("Chip counts cannot be negative")
+    total_chips = sum(stacks)
+    if total_chips <= 0:
+        raise ValueError("A deal needs chip counts; no chips are in play")
+    payouts = [manager.payout_table.prize(len(manager.players), manager.prize_pool_cents, place) or 0
+               for place in range(1, len(player_ids) + 1)]
+    equities = _round_to_total(icm_equities(stacks, payouts, method, **kwargs), sum(payouts))
+
+    bounty_pool = 0
+    if manager.tournament_type == TournamentType.PKO:
+        bounty_pool = sum(manager.players[player_id].bounty_cents or 0 for player_id in player_ids)
+    bounties = _round_to_total(
+        [bounty_pool * chips / total_chips for chips in stacks],
+        bounty_pool)
+
+    return {
+        player_id: DealEquity(
+            player_id=player_id,
+            chips=chips,
+            icm_equity=to_decimal(equity),
+            bounty_equity=to_decimal(bounty),
+            total=to_decimal(equity + bounty)
+        )
+        for player_id, chips, equity, bounty in zip(player_ids, stacks, equities, bounties)
+    }
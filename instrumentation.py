@@ -0,0 +1,232 @@
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+MANAGER_OPERATIONS = ('add_player', 'register_players', 'process_knockout',
+                      'process_multiway_allin', 'process_eliminations',
+                      'calculate_prize', 'get_remaining_players')
+DISPLAY_OPERATIONS = ('update_display', 'on_change', 'update_time')
+
+# Upper bounds in seconds, from 10us to 10s
+LATENCY_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # the last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, observations at or below it), ending with +Inf"""
+        total = 0
+        buckets = []
+        for bound, count in zip(self.bounds + (float('inf'),), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+class Metrics:
+    """Latency histograms and call counts per operation name.
+
+    ``observe`` has the same signature as the simulator's timer hook, so
+    a ``Metrics`` can be passed wherever a ``Timer`` is accepted.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._timing = threading.local()  # set while a timed operation runs on a thread
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        return self._histograms.get(name)
+
+    def prometheus_text(self) -> str:
+        """All histograms in the Prometheus text exposition format"""
+        lines = ["# HELP tournament_operation_seconds Latency of tournament manager and display operations",
+                 "# TYPE tournament_operation_seconds histogram"]
+        with self._lock:
+            histograms = [(name, histogram.cumulative(), histogram.sum, histogram.count)
+                          for name, histogram in sorted(self._histograms.items())]
+        for name, buckets, total, count in histograms:
+            label = f'operation="{name}"'
+            for bound, observed in buckets:
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'tournament_operation_seconds_bucket{{{label},le="{le}"}} {observed}')
+            lines.append(f'tournament_operation_seconds_sum{{{label}}} {total!r}')
+            lines.append(f'tournament_operation_seconds_count{{{label}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str) -> None:
+        """Write the metrics to ``path`` atomically (node exporter textfile format)"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+def _timed(metrics: Metrics, name: str, func):
+    observe = metrics.observe
+    perf_counter = time.perf_counter
+    timing = metrics._timing
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if getattr(timing, 'active', False):
+            # Part of an operation that is already being timed (add_player
+            # calling register_players), so it is not counted twice
+            return func(*args, **kwargs)
+        timing.active = True
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            observe(name, perf_counter() - start)
+            timing.active = False
+    return wrapper
+
+def instrument(obj, metrics: Metrics, operations: Iterable[str], prefix: str = '') -> None:
+    """Time the given methods of one object.
+
+    The timed wrappers are set as instance attributes, so other instances
+    and the class itself are untouched and uninstrumented objects pay
+    nothing. Only the outermost timed call on a thread is recorded.
+    ``uninstrument`` removes them again.
+    """
+    for name in operations:
+        setattr(obj, name, _timed(metrics, prefix + name, getattr(obj, name)))
+
+def uninstrument(obj, operations: Iterable[str]) -> None:
+    for name in operations:
+        obj.__dict__.pop(name, None)
+
+def _display_slots(window):
+    # Signals hold the bound methods they were connected to, so the slots
+    # are reconnected whenever the timed wrappers are added or removed
+    return ((window.change_received, 'on_change'), (window.clock_timer.timeout, 'update_time'))
+
+def instrument_display(window, metrics: Metrics) -> None:
+    """Time a DisplayWindow's full repaints, per-change updates and clock ticks"""
+    for signal, name in _display_slots(window):
+        signal.disconnect(getattr(window, name))
+    instrument(window, metrics, DISPLAY_OPERATIONS, prefix='display_')
+    for signal, name in _display_slots(window):
+        signal.connect(getattr(window, name))
+
+def uninstrument_display(window) -> None:
+    for signal, name in _display_slots(window):
+        signal.disconnect(getattr(window, name))
+    uninstrument(window, DISPLAY_OPERATIONS)
+    for signal, name in _display_slots(window):
+        signal.connect(getattr(window, name))
+
+class MetricsServer:
+    """Serves ``/metrics`` in Prometheus text format from a daemon thread"""
+
+    def __init__(self, metrics: Metrics, port: int = 9108, host: str = '127.0.0.1'):
+        self.metrics = metrics
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = outer.metrics.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.server.serve_forever,
+                                            name='metrics-server', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+
+class Instrumentation:
+    """Opt-in timing of a manager (and optionally its display).
+
+    Metrics are served over HTTP when ``port`` is given and dumped to
+    ``path`` every ``dump_interval`` seconds and on ``close``.
+    """
+
+    def __init__(self, manager, display=None, path: Optional[str] = None,
+                 port: Optional[int] = None, dump_interval: float = 15.0,
+                 metrics: Optional[Metrics] = None):
+        self.metrics = metrics or Metrics()
+        self.manager = manager
+        self.display = display
+        self.path = path
+        self.server: Optional[MetricsServer] = None
+        self._stopping = threading.Event()
+        self._dumper: Optional[threading.Thread] = None
+
+        instrument(manager, self.metrics, MANAGER_OPERATIONS)
+        if display is not None:
+            instrument_display(display, self.metrics)
+        if port is not None:
+            self.server = MetricsServer(self.metrics, port)
+            self.server.start()
+        if path is not None and dump_interval > 0:
+            self._dumper = threading.Thread(target=self._dump_periodically, args=(dump_interval,),
+                                            name='metrics-dump', daemon=True)
+            self._dumper.start()
+
+    def _dump_periodically(self, interval: float) -> None:
+        while not self._stopping.wait(interval):
+            self.metrics.dump(self.path)
+
+    def close(self) -> None:
+        """Remove the hooks, stop serving and write a final dump"""
+        uninstrument(self.manager, MANAGER_OPERATIONS)
+        if self.display is not None:
+            uninstrument_display(self.display)
+            self.display = None
+        self._stopping.set()
+        if self._dumper is not None:
+            self._dumper.join()
+            self._dumper = None
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
+        if self.path is not None:
+            self.metrics.dump(self.path)
@@ -1,103 +1,77 @@
+import os
 import sys
 from decimal import Decimal
-from PyQt6.QtWidgets import QApplication
-from tournament_types import TournamentType, BlindLevel, PayoutStructure
+from event_journal import EventJournal
 from tournament_manager import TournamentManager
-from main_window import AdminWindow, DisplayWindow, TournamentSetupWizard
-
-def create_default_blind_structure():
-    return [
-        BlindLevel(25, 50, 0, 20),
-        BlindLevel(50, 100, 0, 20),
-        BlindLevel(75, 150, 0, 20),
-        BlindLevel(100, 200, 25, 20),
-        BlindLevel(150, 300, 25, 20),
-        BlindLevel(200, 400, 50, 20),
-        BlindLevel(300, 600, 75, 20),
-        BlindLevel(400, 800, 100, 20),
-        BlindLevel(500, 1000, 100, 20),
-        BlindLevel(600, 1200, 200, 20),
-        BlindLevel(800, 1600, 200, 20),
-        BlindLevel(1000, 2000, 300, 20),
-        BlindLevel(1500, 3000, 400, 20),
-        BlindLevel(2000, 4000, 500, 20),
-        BlindLevel(3000, 6000, 1000, 20),
-        BlindLevel(4000, 8000, 1000, 20),
-        BlindLevel(5000, 10000, 1000, 20),
-        BlindLevel(6000, 12000, 2000, 20),
-        BlindLevel(8000, 16000, 2000, 20),
-        BlindLevel(10000, 20000, 3000, 20),
-    ]
-
-def create_default_payout_structures():
-    return [
-        PayoutStructure(
-            positions={
-                1: Decimal('0.65'),
-                2: Decimal('0.35')
-            },
-            min_players=2
-        ),
-        PayoutStructure(
-            positions={
-                1: Decimal('0.50'),
-                2: Decimal('0.30'),
-                3: Decimal('0.20')
-            },
-            min_players=7
-        ),
-        PayoutStructure(
-            positions={
-                1: Decimal('0.40'),
-                2: Decimal('0.25'),
-                3: Decimal('0.15'),
-                4: Decimal('0.12'),
-                5: Decimal('0.08')
-            },
-            min_players=15
-        ),
-        PayoutStructure(
-            positions={
-                1: Decimal('0.35'),
-                2: Decimal('0.20'),
-                3: Decimal('0.15'),
-                4: Decimal('0.10'),
-                5: Decimal('0.08'),
-                6: Decimal('0.07'),
-                7: Decimal('0.05')
-            },
-            min_players=30
-        )
-    ]
+from tournament_types import TournamentType
+from tournament_clock import ClockScheduler
+from tournament_defaults import create_default_blind_structure, create_default_payout_structures
 
 def main():
+    # Qt is only loaded when windows are actually requested; scripts and
+    # workers use service.py / cli.py and never pay for it.
+    from PyQt6.QtWidgets import QApplication
+    from main_window import AdminWindow, DisplayWindow, TournamentSetupWizard
+
     app = QApplication(sys.argv)
-    
-    # Show setup wizard
-    wizard = TournamentSetupWizard()
-    if wizard.exec() != TournamentSetupWizard.DialogCode.Accepted:
-        sys.exit(0)
-        
-    settings = wizard.get_tournament_settings()
-    
+
+    # Every operation is journaled to TOURNAMENT_JOURNAL; after a crash or
+    # restart an existing journal is resumed instead of starting a new event
+    journal_path = os.environ.get('TOURNAMENT_JOURNAL', 'tournament.journal')
+    resuming = os.path.exists(journal_path)
+    if resuming:
+        # The journal's own configuration replaces these on restore
+        settings = {'tournament_type': TournamentType.REGULAR, 'buy_in': Decimal('0'),
+                    'bounty_amount': None}
+    else:
+        # Show setup wizard
+        wizard = TournamentSetupWizard()
+        if wizard.exec() != TournamentSetupWizard.DialogCode.Accepted:
+            sys.exit(0)
+        settings = wizard.get_tournament_settings()
+
     # Create tournament manager with wizard settings and defaults
     manager = TournamentManager(
         tournament_type=settings['tournament_type'],
         buy_in=settings['buy_in'],
         blind_structure=create_default_blind_structure(),
         payout_structures=create_default_payout_structures(),
-        bounty_amount=settings['bounty_amount']
+        bounty_amount=settings['bounty_amount'],
+        journal=EventJournal(journal_path)
     )
+    if resuming:
+        manager.restore()
     
+    # Levels advance on the scheduler's thread whether or not a window is
+    # open; the windows only display them
+    scheduler = ClockScheduler()
+    scheduler.add(manager)
+    scheduler.start()
+
     # Create windows
     admin_window = AdminWindow(manager)
     display_window = DisplayWindow(manager)
     
+    # Timing hooks are opt-in: TOURNAMENT_METRICS_PORT serves Prometheus
+    # metrics, TOURNAMENT_METRICS_FILE dumps them to a file
+    metrics_port = os.environ.get('TOURNAMENT_METRICS_PORT')
+    metrics_file = os.environ.get('TOURNAMENT_METRICS_FILE')
+    instrumentation = None
+    if metrics_port or metrics_file:
+        from instrumentation import Instrumentation
+        instrumentation = Instrumentation(manager, display_window, path=metrics_file,
+                                          port=int(metrics_port) if metrics_port else None)
+    
     # Show windows
     admin_window.show()
     display_window.show()
     
-    sys.exit(app.exec())
+    status = app.exec()
+    scheduler.stop()
+    manager.journal.close()
+    if instrumentation is not None:
+        instrumentation.close()
+    sys.exit(status)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
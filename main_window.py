@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from tournament_manager import TournamentManager
+from event_bus import ChangeType, ChangeEvent
 from tournament_types import TournamentType, BlindLevel, Player, PayoutStructure
 from decimal import Decimal
 from typing import List, Dict, Optional
@@ -65,13 +66,30 @@ class TournamentSetupWizard(QWizard):
         return None
 
 class DisplayWindow(QMainWindow):
+    # Manager change events can be emitted from any thread; the signal
+    # queues them onto the GUI thread.
+    change_received = pyqtSignal(object)
+
+    WATCHED_CHANGES = (ChangeType.LEVEL_CHANGED,
+                       ChangeType.HAND_FOR_HAND_CHANGED,
+                       ChangeType.PLAYERS_REMAINING_CHANGED,
+                       ChangeType.CHIPS_CHANGED,
+                       ChangeType.CLOCK_CHANGED)
+
+    CHIP_LEADERS_SHOWN = 5
+
     def __init__(self, tournament_manager: TournamentManager):
         super().__init__()
         self.tournament_manager = tournament_manager
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_display)
-        self.timer.start(1000)  # Update every second
+        self._hand_for_hand_shown: Optional[bool] = None
+        # Only the countdown needs ticking, and only while the clock runs
+        self.clock_timer = QTimer()
+        self.clock_timer.timeout.connect(self.update_time)
         self.setup_ui()
+        self.change_received.connect(self.on_change)
+        self._listener = self.change_received.emit
+        for change_type in self.WATCHED_CHANGES:
+            tournament_manager.events.subscribe(change_type, self._listener)
         
     def setup_ui(self):
         self.setWindowTitle("Tournament Display")
@@ -126,31 +144,112 @@ class DisplayWindow(QMainWindow):
         self.players_label.setFont(medium_font)
         self.players_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
+        # Average stack and chip leaders
+        small_font = QFont()
+        small_font.setPointSize(24)
+        
+        self.average_label = QLabel()
+        self.average_label.setFont(small_font)
+        self.average_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        self.leaders_label = QLabel()
+        self.leaders_label.setFont(small_font)
+        self.leaders_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
         layout.addWidget(level_group)
         layout.addWidget(self.time_label)
         layout.addWidget(self.status_label)
         layout.addWidget(self.players_label)
+        layout.addWidget(self.average_label)
+        layout.addWidget(self.leaders_label)
         
         central_widget.setLayout(layout)
         self.update_display()
         
     def update_display(self):
-        # Update level info
+        """Repaint every field from the manager's current state"""
+        self.update_level()
+        self.update_status()
+        self.update_players()
+        self.update_chips()
+        self.update_clock()
+
+    def on_change(self, event: ChangeEvent):
+        if event.type == ChangeType.LEVEL_CHANGED:
+            self.update_level()
+            self.update_chips()  # M and big blinds follow the blinds
+        elif event.type == ChangeType.HAND_FOR_HAND_CHANGED:
+            self.update_status()
+        elif event.type == ChangeType.PLAYERS_REMAINING_CHANGED:
+            self.update_players()
+        elif event.type == ChangeType.CHIPS_CHANGED:
+            self.update_chips()
+        elif event.type == ChangeType.CLOCK_CHANGED:
+            self.update_clock()
+
+    @staticmethod
+    def _set_text(label: QLabel, text: str):
+        # Only touch the widget when the value actually changed
+        if label.text() != text:
+            label.setText(text)
+
+    def update_level(self):
         level = self.tournament_manager.get_current_level_info()
-        self.level_label.setText(f"Level: {self.tournament_manager.current_level + 1}")
-        self.blind_label.setText(f"{level.small_blind:,}/{level.big_blind:,}")
-        self.ante_label.setText(f"Ante: {level.ante:,}" if level.ante > 0 else "")
-        
-        # Update status
-        if self.tournament_manager.hand_for_hand:
+        self._set_text(self.level_label, f"Level: {self.tournament_manager.current_level + 1}")
+        if level.is_break:
+            self._set_text(self.blind_label, "BREAK")
+            self._set_text(self.ante_label, "")
+        else:
+            self._set_text(self.blind_label, f"{level.small_blind:,}/{level.big_blind:,}")
+            self._set_text(self.ante_label, f"Ante: {level.ante:,}" if level.ante > 0 else "")
+        self.update_time()
+
+    def update_time(self):
+        remaining = int(self.tournament_manager.clock.state().remaining_seconds)
+        minutes, seconds = divmod(remaining, 60)
+        self._set_text(self.time_label, f"{minutes:02d}:{seconds:02d}")
+
+    def update_clock(self):
+        if self.tournament_manager.clock.running:
+            if not self.clock_timer.isActive():
+                self.clock_timer.start(250)
+        else:
+            self.clock_timer.stop()
+        self.update_time()
+
+    def update_status(self):
+        hand_for_hand = self.tournament_manager.hand_for_hand
+        if hand_for_hand == self._hand_for_hand_shown:
+            return
+        self._hand_for_hand_shown = hand_for_hand
+        if hand_for_hand:
             self.status_label.setText("HAND FOR HAND")
             self.status_label.setStyleSheet("QLabel { color: red; }")
         else:
             self.status_label.setText("")
             self.status_label.setStyleSheet("")
-            
-        # Update players remaining
+
+    def update_players(self):
         remaining = self.tournament_manager.get_remaining_players()
-        self.players_label.setText(f"Players Remaining: {remaining}")
+        self._set_text(self.players_label, f"Players Remaining: {remaining}")
+
+    def update_chips(self):
+        stats = self.tournament_manager.get_chip_stats()
+        if stats.total_chips == 0:
+            self._set_text(self.average_label, "")
+            self._set_text(self.leaders_label, "")
+            return
+        average = f"Average Stack: {stats.average_stack:,.0f}"
+        if stats.big_blinds is not None:
+            average += f" ({stats.big_blinds:.1f} BB, M {stats.m_ratio:.1f})"
+        self._set_text(self.average_label, average)
+        leaders = self.tournament_manager.get_chip_leaders(self.CHIP_LEADERS_SHOWN)
+        self._set_text(self.leaders_label, "\n".join(
+            f"{rank}. {player.name}  {chips:,}" for rank, (player, chips) in enumerate(leaders, 1)))
+
+    def closeEvent(self, event):
+        for change_type in self.WATCHED_CHANGES:
+            self.tournament_manager.events.unsubscribe(change_type, self._listener)
+        super().closeEvent(event)
 
 # ... rest of the file remains unchanged ... 
\ No newline at end of file
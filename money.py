@@ -0,0 +1,49 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import List, Sequence, Union
+
+# Money is held as an integer number of cents in every hot path. Decimal is
+# only used at the boundary: wizard input, display strings and exports.
+Cents = int
+
+_CENT = Decimal('0.01')
+
+def to_cents(amount: Union[Decimal, int, str]) -> Cents:
+    """Convert a currency amount to integer cents, rounding half-even"""
+    return int((Decimal(amount) * 100).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+def to_decimal(cents: Cents) -> Decimal:
+    """Convert integer cents back to a two-place Decimal"""
+    return Decimal(cents).scaleb(-2)
+
+def split(total: Cents, parts: int) -> List[Cents]:
+    """Split ``total`` into ``parts`` near-equal shares that sum exactly to it.
+
+    The leftover cents go one each to the first shares, so callers control
+    who receives them by the order they list recipients in.
+    """
+    share, remainder = divmod(total, parts)
+    return [share + 1] * remainder + [share] * (parts - remainder)
+
+def allocate(total: Cents, fractions: Sequence[Decimal]) -> List[Cents]:
+    """Allocate ``fractions`` of ``total`` with largest-remainder rounding.
+
+    The amounts sum exactly to ``total * sum(fractions)`` rounded to the
+    cent, so a payout table always adds up to the pool it was cut from.
+    """
+    if not fractions:
+        return []
+    exponent = min(f.as_tuple().exponent for f in fractions)
+    scale = 10 ** -exponent if exponent < 0 else 1
+    numerators = [int(f * scale) for f in fractions]
+    amounts = []
+    remainders = []
+    for i, numerator in enumerate(numerators):
+        amount, remainder = divmod(total * numerator, scale)
+        amounts.append(amount)
+        remainders.append((-remainder, i))
+    target, leftover = divmod(total * sum(numerators), scale)
+    if leftover * 2 >= scale:
+        target += 1
+    for _, i in sorted(remainders)[:target - sum(amounts)]:
+        amounts[i] += 1
+    return amounts
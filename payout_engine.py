@@ -0,0 +1,120 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+from money import Cents, allocate
+from tournament_types import PayoutStructure
+
+_SHARE_UNITS = 1_000_000  # generated percentages have six decimal places
+
+def generate_payout_structure(field_size: int,
+                              paid_fraction: Decimal = Decimal('0.15'),
+                              min_cash_multiple: Decimal = Decimal('1.5'),
+                              curve: float = 1.0,
+                              min_players: Optional[int] = None) -> PayoutStructure:
+    """Generate a payout curve for a field of ``field_size`` players.
+
+    ``paid_fraction`` of the field is paid. Every paid place gets at least
+    ``min_cash_multiple`` buy-ins where the pool allows it, and the rest of
+    the pool follows a power law ``1 / place ** curve`` towards the top.
+    The percentages add up to exactly 1.
+    """
+    paid = max(1, min(field_size, int(field_size * paid_fraction)))
+    floor_units = int(_SHARE_UNITS * min_cash_multiple / field_size)
+    if floor_units * paid > _SHARE_UNITS:
+        floor_units = 0
+    weights = [place ** -curve for place in range(1, paid + 1)]
+    total_weight = sum(weights)
+    extra_units = _SHARE_UNITS - floor_units * paid
+    shares = [floor_units + extra_units * w / total_weight for w in weights]
+    units = [int(share) for share in shares]
+    by_remainder = sorted(range(paid), key=lambda i: (units[i] - shares[i], i))
+    for i in by_remainder[:_SHARE_UNITS - sum(units)]:
+        units[i] += 1
+    return PayoutStructure(
+        positions={place: Decimal(u).scaleb(-6) for place, u in enumerate(units, start=1)},
+        min_players=field_size if min_players is None else min_players
+    )
+
+def generate_payout_structures(field_sizes: Iterable[int], **kwargs) -> List[PayoutStructure]:
+    """Generate one structure per field size, each applying from that size up"""
+    return [generate_payout_structure(size, **kwargs) for size in field_sizes]
+
+def _copy(structure: PayoutStructure) -> PayoutStructure:
+    return PayoutStructure(dict(structure.positions), structure.min_players)
+
+class PayoutTable:
+    """Payout structures indexed by ``min_players`` with cached prize tables.
+
+    The structure for a field is found by bisecting the sorted thresholds,
+    and the position -> amount table of a structure is computed once per
+    prize pool, so prizes, the full payout board and the next pay jump are
+    lookups. The table keeps its own copies of the structures, so editing
+    the originals can never leave the index or cache stale; build a new
+    table to change them.
+    """
+
+    def __init__(self, structures: Iterable[PayoutStructure]):
+        self.structures: Tuple[PayoutStructure, ...] = tuple(
+            _copy(s) for s in sorted(structures, key=lambda x: x.min_players))
+        self._thresholds = [s.min_players for s in self.structures]
+        self._cache_key: Optional[Tuple[int, Cents]] = None
+        self._prizes: Dict[int, Cents] = {}
+        self._board: List[Tuple[int, Cents]] = []
+        self._jumps: Dict[int, Optional[int]] = {}
+
+    def invalidate(self) -> None:
+        self._cache_key = None
+
+    def structure_index(self, num_players: int) -> int:
+        return max(bisect_right(self._thresholds, num_players) - 1, 0)
+
+    def copies(self) -> List[PayoutStructure]:
+        return [_copy(s) for s in self.structures]
+
+    def structure_for(self, num_players: int) -> PayoutStructure:
+        """Get the appropriate payout structure based on number of players"""
+        return self.structures[self.structure_index(num_players)]
+
+    def _table(self, num_players: int, prize_pool: Cents) -> Dict[int, Cents]:
+        key = (self.structure_index(num_players), prize_pool)
+        if key != self._cache_key:
+            structure = self.structures[key[0]]
+            places = sorted(structure.positions)
+            amounts = allocate(prize_pool, [structure.positions[p] for p in places])
+            self._board = list(zip(places, amounts))
+            self._prizes = dict(self._board)
+            # For every place, the next better place that pays more
+            self._jumps = {}
+            jump = None
+            for i, (place, amount) in enumerate(self._board):
+                if i and self._board[i - 1][1] > amount:
+                    jump = self._board[i - 1][0]
+                self._jumps[place] = jump
+            self._cache_key = key
+        return self._prizes
+
+    def prize(self, num_players: int, prize_pool: Cents, position: int) -> Optional[Cents]:
+        return self._table(num_players, prize_pool).get(position)
+
+    def board(self, num_players: int, prize_pool: Cents) -> List[Tuple[int, Cents]]:
+        """All paid places and their amounts, best place first"""
+        self._table(num_players, prize_pool)
+        return self._board
+
+    def next_pay_jump(self, num_players: int, prize_pool: Cents,
+                      remaining: int) -> Optional[Tuple[int, Cents]]:
+        """The next place that pays more than the next bust-out will receive.
+
+        The next player out finishes in place ``remaining``; outside the
+        money that is the bubble and the jump is the lowest paid place.
+        """
+        prizes = self._table(num_players, prize_pool)
+        if not self._board or remaining <= 1:
+            return None
+        if remaining not in prizes:
+            last_place = self._board[-1][0]
+            if remaining < last_place:
+                return None
+            return self._board[-1]
+        jump = self._jumps[remaining]
+        return None if jump is None else (jump, prizes[jump])
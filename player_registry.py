@@ -0,0 +1,124 @@
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, ValuesView
+from money import Cents
+from tournament_types import Player
+
+class PlayerRegistry(Mapping):
+    """Player store with an active-player index and incremental counters.
+
+    Behaves as a read-only ``Dict[int, Player]`` for existing callers while
+    keeping separate active/eliminated indexes so that counts and lookups
+    never have to walk the whole field.
+    """
+
+    __slots__ = ('_players', '_active', '_eliminated', '_next_id')
+
+    def __init__(self):
+        self._players: Dict[int, Player] = {}
+        self._active: Dict[int, Player] = {}
+        self._eliminated: Dict[int, Player] = {}
+        self._next_id = 1
+
+    def __getitem__(self, player_id: int) -> Player:
+        return self._players[player_id]
+
+    def __contains__(self, player_id) -> bool:
+        return player_id in self._players
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._players)
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def values(self) -> ValuesView[Player]:
+        return self._players.values()
+
+    def add(self, name: str, bounty_cents: Optional[Cents] = None) -> Player:
+        """Register a new player under the next free ID"""
+        player_id = self._next_id
+        self._next_id += 1
+        player = Player(id=player_id, name=name, bounty_cents=bounty_cents)
+        self._players[player_id] = player
+        self._active[player_id] = player
+        return player
+
+    def add_many(self, names: Iterable[str], bounty_cents: Optional[Cents] = None) -> List[Player]:
+        """Register several players under consecutive IDs"""
+        players = [Player(id=player_id, name=name, bounty_cents=bounty_cents)
+                   for player_id, name in enumerate(names, self._next_id)]
+        self._next_id += len(players)
+        for player in players:
+            self._players[player.id] = player
+            self._active[player.id] = player
+        return players
+
+    def remove(self, player_id: int) -> Player:
+        """Delete an entry that is still active; its ID is never handed out again"""
+        player = self._active.pop(player_id, None)
+        if player is None:
+            raise ValueError(f"Player {self._players[player_id].name} has already been eliminated")
+        del self._players[player_id]
+        return player
+
+    def eliminate(self, player_id: int, position: Optional[int] = None) -> Player:
+        """Move a player from the active to the eliminated index.
+
+        When no position is given the player finishes in the last place
+        still open, i.e. the current number of active players.
+        """
+        player = self._active.pop(player_id, None)
+        if player is None:
+            raise ValueError(f"Player {self._players[player_id].name} has already been eliminated")
+        player.position = len(self._active) + 1 if position is None else position
+        player.eliminated = True
+        self._eliminated[player_id] = player
+        return player
+
+    def restore(self, players: Iterable[Player], next_id: Optional[int] = None) -> None:
+        """Insert already-built players, e.g. when loading a snapshot"""
+        for player in players:
+            self._players[player.id] = player
+            if player.eliminated:
+                self._eliminated[player.id] = player
+            else:
+                self._active[player.id] = player
+            if player.id >= self._next_id:
+                self._next_id = player.id + 1
+        if next_id is not None and next_id > self._next_id:
+            self._next_id = next_id
+
+    def clear(self) -> None:
+        self._players.clear()
+        self._active.clear()
+        self._eliminated.clear()
+        self._next_id = 1
+
+    @property
+    def next_id(self) -> int:
+        return self._next_id
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    @property
+    def eliminated_count(self) -> int:
+        return len(self._eliminated)
+
+    def active(self) -> ValuesView[Player]:
+        """Players still in the tournament, in registration order"""
+        return self._active.values()
+
+    def eliminated(self) -> ValuesView[Player]:
+        """Eliminated players, in elimination order"""
+        return self._eliminated.values()
+
+    def get_active(self, player_id: int) -> Optional[Player]:
+        return self._active.get(player_id)
+
+    def get_eliminated(self, player_id: int) -> Optional[Player]:
+        return self._eliminated.get(player_id)
+
+    def is_active(self, player_id: int) -> bool:
+        return player_id in self._active
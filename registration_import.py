@@ -0,0 +1,62 @@
+import csv
+import json
+import os
+from typing import Iterator, List, Optional
+from tournament_types import Player
+
+# CSV header names accepted for the player name column
+NAME_COLUMNS = ('name', 'player', 'player name', 'player_name')
+
+def read_names(path: str, file_format: Optional[str] = None) -> Iterator[str]:
+    """Stream player names from a CSV or JSON Lines registration file.
+
+    CSV files need a header row with a ``name`` (or ``player``) column.
+    JSONL lines are objects with a ``name`` key or bare strings. The
+    format is taken from the file extension unless given.
+    """
+    file_format = (file_format or os.path.splitext(path)[1].lstrip('.')).lower()
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        if file_format == 'csv':
+            rows = csv.reader(f)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [column.strip().lower() for column in header]
+            column = next((columns.index(name) for name in NAME_COLUMNS if name in columns), None)
+            if column is None:
+                raise ValueError(f"{path}: the header has no name column ({', '.join(NAME_COLUMNS)})")
+            for row in rows:
+                if len(row) > column and row[column].strip():
+                    yield row[column].strip()
+        elif file_format in ('jsonl', 'ndjson'):
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_number}: {e}") from None
+                if isinstance(record, dict):
+                    name = record.get('name')
+                else:
+                    name = record
+                if not isinstance(name, str) or not name.strip():
+                    raise ValueError(f"{path}:{line_number}: no player name")
+                yield name.strip()
+        else:
+            raise ValueError(f"Unsupported registration file format: {file_format!r}")
+
+def import_registrations(manager, path: str, file_format: Optional[str] = None,
+                         batch_size: int = 5000) -> List[Player]:
+    """Register every entry in a pre-registration file, ``batch_size`` at a time.
+
+    The whole file is read and checked first, so a malformed line or a
+    closed registration leaves the tournament untouched.
+    """
+    names = list(read_names(path, file_format))
+    if not manager.registration_open:
+        raise ValueError("Registration is closed")
+    registered: List[Player] = []
+    for start in range(0, len(names), batch_size):
+        registered.extend(manager.register_players(names[start:start + batch_size]))
+    return registered
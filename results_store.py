@@ -0,0 +1,218 @@
+import math
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+from money import to_cents, to_decimal
+from tournament_types import TournamentType
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    series_id INTEGER REFERENCES series(id),
+    name TEXT NOT NULL,
+    tournament_type TEXT NOT NULL,
+    buy_in_cents INTEGER NOT NULL,
+    bounty_cents INTEGER,
+    entries INTEGER NOT NULL,
+    prize_pool_cents INTEGER NOT NULL,
+    finished_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id),
+    series_id INTEGER,
+    year INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    position INTEGER,
+    prize_cents INTEGER NOT NULL,
+    bounty_cents INTEGER NOT NULL,
+    points REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_tournament ON results(tournament_id, position);
+CREATE INDEX IF NOT EXISTS results_by_player ON results(player_name, tournament_id);
+CREATE INDEX IF NOT EXISTS results_by_series ON results(series_id, player_name);
+-- Running totals maintained on every export, so leaderboards are a short
+-- index range scan no matter how many result rows have piled up
+CREATE TABLE IF NOT EXISTS series_totals (
+    series_id INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    winnings_cents INTEGER NOT NULL,
+    prize_cents INTEGER NOT NULL,
+    bounty_cents INTEGER NOT NULL,
+    cashes INTEGER NOT NULL,
+    events INTEGER NOT NULL,
+    PRIMARY KEY (series_id, player_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS series_totals_ranking ON series_totals(series_id, winnings_cents DESC);
+CREATE TABLE IF NOT EXISTS yearly_points (
+    year INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    points REAL NOT NULL,
+    events INTEGER NOT NULL,
+    PRIMARY KEY (year, player_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS yearly_points_ranking ON yearly_points(year, points DESC);
+"""
+
+_INSERT_RESULT = """
+INSERT INTO results (tournament_id, series_id, year, player_name, position,
+                     prize_cents, bounty_cents, points)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_SERIES_TOTAL = """
+INSERT INTO series_totals (series_id, player_name, winnings_cents, prize_cents, bounty_cents, cashes, events)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (series_id, player_name) DO UPDATE SET
+    winnings_cents = winnings_cents + excluded.winnings_cents,
+    prize_cents = prize_cents + excluded.prize_cents,
+    bounty_cents = bounty_cents + excluded.bounty_cents,
+    cashes = cashes + excluded.cashes,
+    events = events + excluded.events
+"""
+
+_UPSERT_YEARLY_POINTS = """
+INSERT INTO yearly_points (year, player_name, points, events) VALUES (?, ?, ?, ?)
+ON CONFLICT (year, player_name) DO UPDATE SET
+    points = points + excluded.points,
+    events = events + excluded.events
+"""
+
+# (entries, position) -> player-of-the-year points
+PointsFormula = Callable[[int, int], float]
+
+def default_points(entries: int, position: int) -> float:
+    """More points for bigger fields and deeper runs, falling off with the square root"""
+    return round(10 * math.sqrt(entries / position), 2)
+
+class ResultsStore:
+    """SQLite store of finished tournaments for cross-event history.
+
+    A tournament's rows go in as one transaction through prepared,
+    batched statements, so exporting a large field costs one commit
+    instead of one per player. Results are indexed by player and series,
+    and per-series and per-year running totals are updated in the same
+    transaction, so leaderboards read a few index entries rather than
+    aggregating every result row.
+    """
+
+    def __init__(self, path: str, points_formula: PointsFormula = default_points):
+        self.connection = sqlite3.connect(path)
+        self.points_formula = points_formula
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _series_id(self, name: Optional[str]) -> Optional[int]:
+        if name is None:
+            return None
+        self.connection.execute("INSERT OR IGNORE INTO series (name) VALUES (?)", (name,))
+        return self.connection.execute("SELECT id FROM series WHERE name = ?", (name,)).fetchone()[0]
+
+    def record_tournament(self, manager, name: str, series: Optional[str] = None,
+                          finished_at: Optional[datetime] = None) -> int:
+        """Store every entry of a finished tournament; returns the tournament's row ID.
+
+        Players still active are recorded as sharing first place (one
+        player once the event is over), and tied players split the prizes
+        of the places they cover. Bounty winnings include a winner's own
+        remaining bounty.
+        """
+        finished_at = finished_at or datetime.now()
+        entries = len(manager.players)
+        pool = manager.prize_pool_cents
+        prizes = {player_id: to_cents(prize) for player_id, prize in manager.get_player_prizes().items()}
+        bounty_cents = None if manager.bounty_amount is None else to_cents(manager.bounty_amount)
+        pko = manager.tournament_type == TournamentType.PKO
+        points = self.points_formula
+        year = finished_at.year
+
+        with self.connection:
+            series_id = self._series_id(series)
+            cursor = self.connection.execute(
+                "INSERT INTO tournaments (series_id, name, tournament_type, buy_in_cents, bounty_cents,"
+                " entries, prize_pool_cents, finished_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (series_id, name, manager.tournament_type.name, to_cents(manager.buy_in), bounty_cents,
+                 entries, pool, finished_at.isoformat(timespec='seconds')))
+            tournament_id = cursor.lastrowid
+
+            rows = []
+            # A player's entries (re-entries included) roll up into one line per event
+            totals: Dict[str, List] = {}
+            for player in manager.players.values():
+                position = player.position if player.eliminated else 1
+                prize = prizes.get(player.id, 0)
+                bounty = player.bounty_won_cents
+                if pko and not player.eliminated:
+                    bounty += player.bounty_cents or 0
+                earned = points(entries, position) if position else 0.0
+                rows.append((tournament_id, series_id, year, player.name, position,
+                             prize, bounty, earned))
+                total = totals.get(player.name)
+                if total is None:
+                    totals[player.name] = [prize, bounty, 1 if prize else 0, earned]
+                else:
+                    total[0] += prize
+                    total[1] += bounty
+                    total[2] += 1 if prize else 0
+                    total[3] = max(total[3], earned)
+
+            self.connection.executemany(_INSERT_RESULT, rows)
+            if series_id is not None:
+                self.connection.executemany(_UPSERT_SERIES_TOTAL, (
+                    (series_id, player_name, prize + bounty, prize, bounty, cashes, 1)
+                    for player_name, (prize, bounty, cashes, _) in totals.items()))
+            self.connection.executemany(_UPSERT_YEARLY_POINTS, (
+                (year, player_name, earned, 1)
+                for player_name, (_, _, _, earned) in totals.items()))
+        return tournament_id
+
+    def series_leaderboard(self, series: str, limit: int = 100) -> List[Tuple[str, Decimal, Decimal, int]]:
+        """(player, prize money, bounty money, cashes) for a series, biggest earners first"""
+        query = """
+            SELECT player_name, prize_cents, bounty_cents, cashes
+            FROM series_totals
+            WHERE series_id = (SELECT id FROM series WHERE name = ?)
+            ORDER BY winnings_cents DESC
+            LIMIT ?
+        """
+        return [(player, to_decimal(prizes), to_decimal(bounties), cashes)
+                for player, prizes, bounties, cashes in self.connection.execute(query, (series, limit))]
+
+    def player_of_the_year(self, year: int, limit: int = 100) -> List[Tuple[str, float, int]]:
+        """(player, points, events played) for a calendar year, most points first"""
+        query = """
+            SELECT player_name, ROUND(points, 2), events
+            FROM yearly_points
+            WHERE year = ?
+            ORDER BY points DESC
+            LIMIT ?
+        """
+        return self.connection.execute(query, (year, limit)).fetchall()
+
+    def player_history(self, player_name: str) -> List[Tuple[str, str, Optional[int], Decimal, Decimal]]:
+        """(tournament, finished at, position, prize, bounties) for every event a player entered"""
+        query = """
+            SELECT t.name, t.finished_at, r.position, r.prize_cents, r.bounty_cents
+            FROM results r JOIN tournaments t ON t.id = r.tournament_id
+            WHERE r.player_name = ?
+            ORDER BY t.finished_at
+        """
+        return [(name, finished_at, position, to_decimal(prize), to_decimal(bounty))
+                for name, finished_at, position, prize, bounty
+                in self.connection.execute(query, (player_name,))]
+
+    def tournament_results(self, tournament_id: int) -> List[Tuple[str, Optional[int], Decimal, Decimal]]:
+        query = """
+            SELECT player_name, position, prize_cents, bounty_cents
+            FROM results WHERE tournament_id = ? ORDER BY position
+        """
+        return [(player, position, to_decimal(prize), to_decimal(bounty))
+                for player, position, prize, bounty in self.connection.execute(query, (tournament_id,))]
@@ -0,0 +1,208 @@
+import heapq
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+@dataclass
+class SeatMove:
+    player_id: int
+    from_table: Optional[int]  # None for a new seat assignment
+    from_seat: Optional[int]
+    to_table: int
+    to_seat: int
+
+class _Table:
+    __slots__ = ('id', 'seats', 'count')
+
+    def __init__(self, table_id: int, size: int):
+        self.id = table_id
+        self.seats: List[Optional[int]] = [None] * size
+        self.count = 0
+
+class SeatingEngine:
+    """Table draw and incremental balancing for multi-table tournaments.
+
+    Table sizes are tracked in a min-heap and a max-heap with lazy
+    invalidation (an entry is live while it matches the table's current
+    count), so after a bust-out finding the tables to balance, or the
+    next table to break, costs O(log tables) rather than a full reseat.
+
+    Tables break in ``break_order`` (highest table number first by
+    default). Once the field fits at the final table, everyone left is
+    redrawn at the table that breaks last.
+    """
+
+    def __init__(self, table_size: int = 9, final_table_size: Optional[int] = None,
+                 break_order: Optional[Sequence[int]] = None, seed: Optional[int] = None):
+        self.table_size = table_size
+        self.final_table_size = min(final_table_size or table_size, table_size)
+        self.rng = random.Random(seed)
+        self.tables: Dict[int, _Table] = {}
+        self.seat_of: Dict[int, Tuple[int, int]] = {}
+        self._break_rank = {table_id: rank for rank, table_id in enumerate(break_order or ())}
+        self._min_heap: List[Tuple[int, int]] = []
+        self._max_heap: List[Tuple[int, int]] = []
+        self._break_heap: List[Tuple[Tuple[int, int], int]] = []
+        self.final_table_drawn = False
+
+    def __len__(self) -> int:
+        return len(self.seat_of)
+
+    # Heap bookkeeping
+
+    def _rank(self, table_id: int) -> Tuple[int, int]:
+        rank = self._break_rank.get(table_id)
+        return (0, rank) if rank is not None else (1, -table_id)
+
+    def _push(self, table: _Table) -> None:
+        heapq.heappush(self._min_heap, (table.count, table.id))
+        heapq.heappush(self._max_heap, (-table.count, -table.id))
+        if len(self._min_heap) > 4 * len(self.tables) + 16:
+            self._min_heap = [(t.count, t.id) for t in self.tables.values()]
+            self._max_heap = [(-t.count, -t.id) for t in self.tables.values()]
+            heapq.heapify(self._min_heap)
+            heapq.heapify(self._max_heap)
+
+    def _smallest(self) -> _Table:
+        heap = self._min_heap
+        while True:
+            count, table_id = heap[0]
+            table = self.tables.get(table_id)
+            if table is not None and table.count == count:
+                return table
+            heapq.heappop(heap)
+
+    def _largest(self) -> _Table:
+        heap = self._max_heap
+        while True:
+            count, table_id = heap[0]
+            table = self.tables.get(-table_id)
+            if table is not None and table.count == -count:
+                return table
+            heapq.heappop(heap)
+
+    def _next_to_break(self) -> _Table:
+        heap = self._break_heap
+        while heap[0][1] not in self.tables:
+            heapq.heappop(heap)
+        return self.tables[heap[0][1]]
+
+    def _open_table(self, table_id: int) -> _Table:
+        table = _Table(table_id, self.table_size)
+        self.tables[table_id] = table
+        heapq.heappush(self._break_heap, (self._rank(table_id), table_id))
+        self._push(table)
+        return table
+
+    # Seat changes
+
+    def _place(self, player_id: int, table: _Table, seat: Optional[int] = None) -> int:
+        if seat is None:
+            seat = self.rng.choice([i for i, p in enumerate(table.seats) if p is None])
+        table.seats[seat] = player_id
+        table.count += 1
+        self.seat_of[player_id] = (table.id, seat)
+        self._push(table)
+        return seat
+
+    def _vacate(self, player_id: int) -> Tuple[_Table, int]:
+        table_id, seat = self.seat_of.pop(player_id)
+        table = self.tables[table_id]
+        table.seats[seat] = None
+        table.count -= 1
+        self._push(table)
+        return table, seat
+
+    def _move(self, player_id: int, to_table: _Table) -> SeatMove:
+        from_table, from_seat = self._vacate(player_id)
+        to_seat = self._place(player_id, to_table)
+        return SeatMove(player_id, from_table.id, from_seat, to_table.id, to_seat)
+
+    def draw(self, player_ids: Iterable[int]) -> List[SeatMove]:
+        """Random draw of the whole field onto as few balanced tables as possible"""
+        players = list(player_ids)
+        self.rng.shuffle(players)
+        self.tables.clear()
+        self.seat_of.clear()
+        self._min_heap.clear()
+        self._max_heap.clear()
+        self._break_heap.clear()
+        self.final_table_drawn = False
+        table_count = max(1, -(-len(players) // self.table_size))
+        tables = [self._open_table(table_id) for table_id in range(1, table_count + 1)]
+        assignments = []
+        for i, player_id in enumerate(players):
+            table = tables[i % table_count]
+            seat = self._place(player_id, table)
+            assignments.append(SeatMove(player_id, None, None, table.id, seat))
+        return assignments
+
+    def seat_players(self, player_ids: Iterable[int]) -> List[SeatMove]:
+        """Seat late registrations at the shortest tables, opening tables as needed"""
+        moves = []
+        for player_id in player_ids:
+            table = self._smallest() if self.tables else None
+            if table is None or table.count >= self.table_size:
+                table = self._open_table(max(self.tables, default=0) + 1)
+            seat = self._place(player_id, table)
+            moves.append(SeatMove(player_id, None, None, table.id, seat))
+        moves.extend(self.rebalance())
+        return moves
+
+    def remove_players(self, player_ids: Iterable[int]) -> List[SeatMove]:
+        """Free the seats of busted players and return the moves that rebalance the room"""
+        for player_id in player_ids:
+            if player_id in self.seat_of:
+                self._vacate(player_id)
+        return self.rebalance()
+
+    def rebalance(self) -> List[SeatMove]:
+        moves: List[SeatMove] = []
+        remaining = len(self.seat_of)
+        if not self.tables or remaining == 0:
+            return moves
+
+        if len(self.tables) > 1 and remaining <= self.final_table_size:
+            return self._draw_final_table()
+
+        # Break tables while the field fits on one table fewer
+        while len(self.tables) > 1 and remaining <= (len(self.tables) - 1) * self.table_size:
+            broken = self._next_to_break()
+            del self.tables[broken.id]
+            for seat, player_id in enumerate(broken.seats):
+                if player_id is None:
+                    continue
+                del self.seat_of[player_id]
+                target = self._smallest()
+                to_seat = self._place(player_id, target)
+                moves.append(SeatMove(player_id, broken.id, seat, target.id, to_seat))
+
+        # Then even out table sizes one player at a time
+        while len(self.tables) > 1:
+            largest = self._largest()
+            smallest = self._smallest()
+            if largest.count - smallest.count <= 1:
+                break
+            player_id = self.rng.choice([p for p in largest.seats if p is not None])
+            moves.append(self._move(player_id, smallest))
+        return moves
+
+    def _draw_final_table(self) -> List[SeatMove]:
+        final = max(self.tables.values(), key=lambda t: self._rank(t.id))
+        players = list(self.seat_of.items())
+        self.rng.shuffle(players)
+        for table_id in list(self.tables):
+            if table_id != final.id:
+                del self.tables[table_id]
+        final.seats = [None] * self.table_size
+        final.count = 0
+        seats = self.rng.sample(range(self.table_size), len(players))
+        moves = []
+        for (player_id, (from_table, from_seat)), seat in zip(players, seats):
+            self._place(player_id, final, seat)
+            moves.append(SeatMove(player_id, from_table, from_seat, final.id, seat))
+        self.final_table_drawn = True
+        return moves
+
+    def table_counts(self) -> Dict[int, int]:
+        return {table_id: table.count for table_id, table in self.tables.items()}
@@ -0,0 +1,165 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+from tournament_types import TournamentType, BlindLevel, PayoutStructure, MultiwayAllInResult
+from tournament_manager import TournamentManager
+from tournament_defaults import create_default_blind_structure, create_default_payout_structures
+from event_journal import EventJournal
+from tournament_clock import ClockScheduler
+
+if TYPE_CHECKING:
+    from blind_planner import BlindPlan  # imported lazily: it pulls in the process pool
+
+class TournamentService:
+    """Headless API over TournamentManager.
+
+    Nothing here imports Qt, so short-lived workers (payouts, reports,
+    imports) start in milliseconds and run without a display.
+    """
+
+    def __init__(self, manager: TournamentManager):
+        self.manager = manager
+        self.scheduler: Optional[ClockScheduler] = None
+        self._owns_scheduler = False
+
+    @classmethod
+    def create(cls, tournament_type: Union[TournamentType, str] = TournamentType.REGULAR,
+               buy_in: Decimal = Decimal('100'),
+               bounty_amount: Optional[Decimal] = None,
+               blind_structure: Optional[List[BlindLevel]] = None,
+               payout_structures: Optional[List[PayoutStructure]] = None,
+               journal_path: Optional[str] = None,
+               starting_stack: int = 0,
+               late_registration_levels: Optional[int] = None) -> 'TournamentService':
+        """Create a tournament, restoring it from ``journal_path`` if that journal exists.
+
+        ``tournament_type`` may be given by name ("regular", "pko") as well.
+        PKO events need a ``bounty_amount``.
+        """
+        if isinstance(tournament_type, str):
+            tournament_type = TournamentType[tournament_type.upper()]
+        journal = EventJournal(journal_path) if journal_path else None
+        manager = TournamentManager(
+            tournament_type=tournament_type,
+            buy_in=Decimal(buy_in),
+            blind_structure=blind_structure or create_default_blind_structure(),
+            payout_structures=payout_structures or create_default_payout_structures(),
+            bounty_amount=Decimal(bounty_amount) if bounty_amount is not None else None,
+            journal=journal,
+            starting_stack=starting_stack,
+            late_registration_levels=late_registration_levels
+        )
+        if journal is not None:
+            manager.restore()
+        return cls(manager)
+
+    def run_clock(self, scheduler: Optional[ClockScheduler] = None) -> ClockScheduler:
+        """Advance levels as the clock runs out, on ``scheduler`` or on a scheduler thread of our own"""
+        if self.scheduler is None:
+            self._owns_scheduler = scheduler is None
+            self.scheduler = scheduler or ClockScheduler()
+            self.scheduler.add(self.manager)
+            if self._owns_scheduler:
+                self.scheduler.start()
+        return self.scheduler
+
+    def start_clock(self) -> None:
+        self.manager.start_clock()
+
+    def pause_clock(self) -> None:
+        self.manager.pause_clock()
+
+    def register(self, names: Iterable[str]) -> List[int]:
+        return [player.id for player in self.manager.register_players(names)]
+
+    def import_registrations(self, path: str, file_format: Optional[str] = None) -> List[int]:
+        """Register every entry in a CSV or JSONL pre-registration file"""
+        from registration_import import import_registrations
+        return [player.id for player in import_registrations(self.manager, path, file_format)]
+
+    def reenter(self, player_id: int) -> int:
+        return self.manager.reenter(player_id).id
+
+    def rebuy(self, player_id: int) -> None:
+        self.manager.rebuy(player_id)
+
+    def remove_entry(self, player_id: int) -> Decimal:
+        return self.manager.remove_entry(player_id)
+
+    def knockout(self, eliminator_id: int, eliminated_id: int) -> Decimal:
+        return self.manager.process_knockout(eliminator_id, eliminated_id)
+
+    def multiway(self, finishing_positions: Dict[int, int]) -> Dict[int, Decimal]:
+        players = [self.manager.players[player_id] for player_id in finishing_positions]
+        return self.manager.process_multiway_allin(MultiwayAllInResult(players, finishing_positions))
+
+    def chip_counts(self, counts: Dict[int, int]) -> None:
+        self.manager.update_chip_counts(counts)
+
+    def chip_leaders(self, count: int = 10) -> List[Tuple[str, int]]:
+        return [(player.name, chips) for player, chips in self.manager.get_chip_leaders(count)]
+
+    def replan(self, target_minutes: float, field_size: Optional[int] = None, **kwargs) -> 'BlindPlan':
+        """Re-plan the rest of the event to finish ``target_minutes`` after its start.
+
+        The players still in (or ``field_size``) are planned for with the
+        average stack, continuing from the current big blind (and antes)
+        over the time left. Levels already played are kept and the plan
+        follows them.
+        """
+        from blind_planner import plan_blind_structure
+        manager = self.manager
+        players = field_size or manager.get_remaining_players()
+        if players < 2:
+            raise ValueError("A tournament needs at least two players")
+        total_chips = manager.chips.total_chips
+        if not total_chips:
+            raise ValueError("Planning needs the chips in play; set the starting stack")
+        remaining_minutes = target_minutes - manager.clock.elapsed() / 60
+        if remaining_minutes <= 0:
+            raise ValueError(f"The event has already run past {target_minutes} minutes")
+        stack = total_chips // players
+        level = manager.get_current_level_info()
+        kwargs.setdefault('starting_depths', (max(1, round(stack / level.big_blind)),))
+        kwargs.setdefault('first_big_blind', level.big_blind)
+        if level.ante:
+            kwargs.setdefault('ante_from_level', 1)
+        plan = plan_blind_structure(stack, players, remaining_minutes, **kwargs)
+        manager.set_blind_structure(manager.blind_structure[:manager.current_level] + plan.structure)
+        return plan
+
+    def payouts(self) -> List[Tuple[int, Decimal]]:
+        return self.manager.get_payout_board()
+
+    def status(self) -> Dict:
+        """Plain-data summary of the tournament, suitable for JSON"""
+        manager = self.manager
+        level = manager.get_current_level_info()
+        clock = manager.clock.state()
+        jump = manager.get_next_pay_jump()
+        chips = manager.get_chip_stats()
+        return {
+            'tournament_type': manager.tournament_type.value,
+            'entries': len(manager.players),
+            'remaining': manager.get_remaining_players(),
+            'prize_pool': str(manager.total_prize_pool),
+            'level': manager.current_level + 1,
+            'blinds': 'BREAK' if level.is_break else f"{level.small_blind}/{level.big_blind}",
+            'ante': level.ante,
+            'time_remaining': int(clock.remaining_seconds),
+            'clock_running': clock.running,
+            'hand_for_hand': manager.hand_for_hand,
+            'registration_open': manager.registration_open,
+            'total_chips': chips.total_chips,
+            'average_stack': round(chips.average_stack),
+            'average_big_blinds': None if chips.big_blinds is None else round(chips.big_blinds, 1),
+            'next_pay_jump': None if jump is None else {'place': jump[0], 'prize': str(jump[1])},
+        }
+
+    def close(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.remove(self.manager)
+            if self._owns_scheduler:
+                self.scheduler.stop()
+            self.scheduler = None
+        if self.manager.journal is not None:
+            self.manager.journal.close()
@@ -0,0 +1,173 @@
+import random
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+from money import to_cents
+from tournament_types import TournamentType, MultiwayAllInResult
+from tournament_manager import TournamentManager
+from tournament_defaults import create_default_blind_structure, create_default_payout_structures
+
+# Called with (operation name, seconds) after every timed manager call
+Timer = Callable[[str, float], None]
+
+@dataclass
+class SimulationResult:
+    manager: TournamentManager
+    operations: Dict[str, int] = field(default_factory=dict)
+    prizes: Dict[int, Decimal] = field(default_factory=dict)  # by player ID
+    violations: List[str] = field(default_factory=list)
+
+class TournamentSimulator:
+    """Seeded Monte Carlo run of a whole event through the public manager API.
+
+    Registers ``field_size`` players with ``add_player``, busts them with a
+    random mix of ``process_knockout`` and ``process_multiway_allin`` while
+    advancing levels, posts a counted hand with ``update_chip_counts``
+    before every bust, polls the remaining players, chip stats and chip
+    leaders like a display would, and finally pays every player with
+    ``get_player_prizes``. The same seed always produces the same event.
+    """
+
+    def __init__(self, field_size: int,
+                 tournament_type: TournamentType = TournamentType.PKO,
+                 buy_in: Decimal = Decimal('100'),
+                 bounty_amount: Decimal = Decimal('50'),
+                 seed: int = 0,
+                 multiway_rate: float = 0.1,
+                 max_multiway: int = 6,
+                 eliminations_per_level: Optional[int] = None,
+                 starting_stack: int = 10_000,
+                 timer: Optional[Timer] = None):
+        self.field_size = field_size
+        self.rng = random.Random(seed)
+        self.multiway_rate = multiway_rate
+        self.max_multiway = max_multiway
+        self.blind_structure = create_default_blind_structure()
+        self.eliminations_per_level = eliminations_per_level or max(1, field_size // len(self.blind_structure))
+        self.timer = timer
+        self.manager = TournamentManager(
+            tournament_type=tournament_type,
+            buy_in=buy_in,
+            blind_structure=self.blind_structure,
+            payout_structures=create_default_payout_structures(),
+            bounty_amount=bounty_amount if tournament_type == TournamentType.PKO else None,
+            starting_stack=starting_stack
+        )
+        self.result = SimulationResult(self.manager)
+        self._active: List[int] = []
+        self._index: Dict[int, int] = {}
+
+    def _call(self, name: str, func, *args):
+        operations = self.result.operations
+        operations[name] = operations.get(name, 0) + 1
+        if self.timer is None:
+            return func(*args)
+        start = time.perf_counter()
+        value = func(*args)
+        self.timer(name, time.perf_counter() - start)
+        return value
+
+    def _remove_active(self, player_id: int) -> None:
+        # Swap-remove keeps random picks O(1)
+        i = self._index.pop(player_id)
+        last = self._active.pop()
+        if last != player_id:
+            self._active[i] = last
+            self._index[last] = i
+
+    def register(self) -> None:
+        for i in range(self.field_size):
+            player = self._call('add_player', self.manager.add_player, f"Player {i + 1}")
+            self._index[player.id] = len(self._active)
+            self._active.append(player.id)
+
+    def _counted_hand(self) -> None:
+        # One player wins part of another's stack, never all of it
+        winner_id, loser_id = self.rng.sample(self._active, 2)
+        chips = self.manager.chips
+        winner, loser = chips.get(winner_id), chips.get(loser_id)
+        pot = self.rng.randint(0, max(0, loser - 1))
+        self._call('update_chip_counts', self.manager.update_chip_counts,
+                   {winner_id: winner + pot, loser_id: loser - pot})
+
+    def play(self) -> None:
+        manager = self.manager
+        pko = manager.tournament_type == TournamentType.PKO
+        eliminations = 0
+        while len(self._active) > 1:
+            self._counted_hand()
+            remaining = len(self._active)
+            if not pko or (remaining >= 3 and self.rng.random() < self.multiway_rate):
+                size = self.rng.randint(2, min(self.max_multiway, remaining))
+                ids = self.rng.sample(self._active, size)
+                positions = {ids[0]: 1}
+                for player_id in ids[1:]:
+                    positions[player_id] = self.rng.randint(2, size)
+                players = [manager.players[player_id] for player_id in ids]
+                self._call('process_multiway_allin', manager.process_multiway_allin,
+                           MultiwayAllInResult(players, positions))
+                busted = ids[1:]
+            else:
+                eliminator_id, eliminated_id = self.rng.sample(self._active, 2)
+                self._call('process_knockout', manager.process_knockout, eliminator_id, eliminated_id)
+                busted = [eliminated_id]
+            for player_id in busted:
+                self._remove_active(player_id)
+            eliminations += len(busted)
+            if eliminations >= self.eliminations_per_level:
+                eliminations = 0
+                self._call('next_level', manager.next_level)
+            self._call('get_remaining_players', manager.get_remaining_players)
+            self._call('get_chip_stats', manager.get_chip_stats)
+            self._call('get_chip_leaders', manager.get_chip_leaders, 10)
+
+    def pay_out(self) -> None:
+        self.result.prizes = self._call('get_player_prizes', self.manager.get_player_prizes)
+
+    def run(self) -> SimulationResult:
+        self.register()
+        self.play()
+        self.pay_out()
+        self.result.violations = check_invariants(self.manager, self.result.prizes)
+        return self.result
+
+def check_invariants(manager: TournamentManager, prizes: Dict[int, Decimal]) -> List[str]:
+    """Return a description of every broken invariant (empty when all hold)"""
+    violations = []
+    players = manager.players
+    entries = len(players)
+    if manager.get_remaining_players() != sum(1 for p in players.values() if not p.eliminated):
+        violations.append("remaining-player counter disagrees with player states")
+    if manager.tournament_type == TournamentType.PKO:
+        pool = entries * to_cents(manager.bounty_amount)
+        held = sum((p.bounty_cents or 0) + p.bounty_won_cents for p in players.values())
+        if held != pool:
+            violations.append(f"bounties not conserved: {held} cents held, {pool} cents paid in")
+    active_chips = sum(p.chips for p in players.active())
+    if manager.chips.total_chips != active_chips or len(manager.chips) != players.active_count:
+        violations.append("chip index disagrees with player stacks")
+    if active_chips != entries * manager.starting_stack:
+        violations.append(f"chips not conserved: {active_chips} in play, {entries * manager.starting_stack} issued")
+    total_share = sum(manager.get_active_payout_structure().positions.values())
+    expected = (manager.total_prize_pool * total_share).quantize(Decimal('0.01'))
+    paid = sum(prizes.values(), Decimal('0'))
+    if paid != expected:
+        violations.append(f"payouts sum to {paid}, expected {expected}")
+    # Players tied for a place share the prizes of every place they cover
+    groups: Dict[int, List[int]] = {}
+    for player in players.values():
+        groups.setdefault(player.position if player.eliminated else 1, []).append(player.id)
+    for position, player_ids in sorted(groups.items()):
+        covered = sum((manager.calculate_prize(place) or Decimal('0')
+                       for place in range(position, position + len(player_ids))), Decimal('0'))
+        shares = [prizes.get(player_id, Decimal('0')) for player_id in player_ids]
+        if sum(shares, Decimal('0')) != covered or max(shares) - min(shares) > Decimal('0.01'):
+            violations.append(f"players tied for place {position} are paid {sum(shares)}, "
+                              f"the places they cover pay {covered}")
+            break
+    for player in players.eliminated():
+        if not 2 <= (player.position or 0) <= entries:
+            violations.append(f"player {player.id} finished in impossible place {player.position}")
+            break
+    return violations
@@ -0,0 +1,25 @@
+import os
+import sys
+from decimal import Decimal
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tournament_types import TournamentType
+from tournament_manager import TournamentManager
+from tournament_defaults import create_default_blind_structure, create_default_payout_structures
+
+@pytest.fixture
+def make_manager():
+    """Factory for managers with the default structures"""
+    def make(tournament_type=TournamentType.PKO, buy_in='100', bounty='50', **kwargs):
+        return TournamentManager(
+            tournament_type=tournament_type,
+            buy_in=Decimal(buy_in),
+            blind_structure=kwargs.pop('blind_structure', None) or create_default_blind_structure(),
+            payout_structures=kwargs.pop('payout_structures', None) or create_default_payout_structures(),
+            bounty_amount=Decimal(bounty) if tournament_type == TournamentType.PKO else None,
+            **kwargs
+        )
+    return make
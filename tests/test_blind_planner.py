@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from blind_planner import FinishModel, build_structure, nice_chips, plan_blind_structure, simulate_finish
+
+def test_nice_chips_rounds_to_floor_values():
+    assert [nice_chips(v) for v in (0.3, 1, 26, 140, 1180, 3600, 71_000)] == [1, 1, 25, 150, 1000, 4000, 75_000]
+
+def test_structure_grows_with_breaks_and_antes():
+    structure = build_structure(20_000, 100, 30, 1.4, 100, break_every=4, break_minutes=10)
+    levels = [level for level in structure if not level.is_break]
+    assert levels[0].big_blind == 200
+    assert all(a.big_blind < b.big_blind for a, b in zip(levels, levels[1:]))
+    assert all(level.small_blind * 2 == level.big_blind for level in levels)
+    assert [level.ante > 0 for level in levels[:4]] == [False, False, False, True]
+    assert structure[4].is_break and structure[4].duration_minutes == 10
+    assert structure[4].big_blind == structure[3].big_blind
+    assert levels[-1].big_blind * 8 >= 20_000 * 100
+
+def test_structure_can_continue_from_a_big_blind():
+    structure = build_structure(20_000, 300, 20, 1.33, 17, ante_from_level=1, first_big_blind=1200)
+    assert (structure[0].big_blind, structure[0].ante > 0) == (1200, True)
+
+def test_finish_time_grows_with_level_length():
+    def median(minutes):
+        structure = build_structure(10_000, 200, minutes, 1.4, 100)
+        rng = random.Random(1)
+        return sorted(simulate_finish(structure, 200, 10_000, FinishModel(), rng) for _ in range(41))[20]
+    assert median(15) < median(30) < median(60)
+
+def test_plan_is_reproducible_and_near_target():
+    kwargs = dict(level_minutes=(15, 30), growths=(1.33, 1.5), starting_depths=(100,), trials=60, max_workers=1)
+    plan = plan_blind_structure(10_000, 200, 360, seed=4, **kwargs)
+    again = plan_blind_structure(10_000, 200, 360, seed=4, **kwargs)
+    assert plan.structure == again.structure and plan.finish_minutes == again.finish_minutes
+    assert plan.candidates == 4
+    assert plan.p10_minutes <= plan.p50_minutes <= plan.p90_minutes
+    with pytest.raises(ValueError):
+        plan_blind_structure(10_000, 1, 360, **kwargs)
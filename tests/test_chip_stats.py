@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from chip_stats import ChipLeaderboard
+from tournament_types import TournamentType
+
+def reference(stacks):
+    return sorted(stacks.items(), key=lambda item: (-item[1], item[0]))
+
+def check(board, stacks):
+    ordered = reference(stacks)
+    assert board.top(len(stacks) + 1) == ordered
+    assert board.top(7) == ordered[:7]
+    assert board.total_chips == sum(stacks.values())
+    assert len(board) == len(stacks)
+    for rank, (player_id, _) in enumerate(ordered, 1):
+        assert board.rank(player_id) == rank
+
+@pytest.fixture
+def small_buckets(monkeypatch):
+    # Small buckets exercise splits and empty buckets with few players
+    monkeypatch.setattr(ChipLeaderboard, 'BUCKET_SIZE', 4)
+
+def test_random_updates_match_sorted_reference(small_buckets):
+    rng = random.Random(7)
+    board = ChipLeaderboard()
+    stacks = {}
+    for step in range(3000):
+        action = rng.random()
+        if stacks and action < 0.25:
+            player_id = rng.choice(list(stacks))
+            assert board.remove(player_id) == stacks.pop(player_id)
+        elif stacks and action < 0.35:
+            counts = {player_id: rng.randint(0, 50) for player_id in rng.sample(list(stacks), min(len(stacks), 20))}
+            board.set_many(counts)
+            stacks.update(counts)
+        else:
+            player_id = rng.randint(1, 200)
+            stacks[player_id] = rng.randint(0, 50)  # plenty of equal stacks
+            board.set(player_id, stacks[player_id])
+        if step % 50 == 0:
+            check(board, stacks)
+    check(board, stacks)
+
+def test_rebuild_and_bulk_updates(small_buckets):
+    board = ChipLeaderboard()
+    stacks = {player_id: (player_id * 37) % 101 for player_id in range(1, 60)}
+    board.rebuild(stacks.items())
+    check(board, stacks)
+    updates = {player_id: 1000 - player_id for player_id in range(1, 60, 2)}
+    board.set_many(updates)
+    stacks.update(updates)
+    check(board, stacks)
+    with pytest.raises(ValueError):
+        board.set_many({1: -1})
+    with pytest.raises(ValueError):
+        board.set(1, -1)
+    check(board, stacks)
+
+def test_knockouts_conserve_chips(make_manager):
+    manager = make_manager(TournamentType.PKO, starting_stack=5000)
+    manager.register_players(f"P{i}" for i in range(1, 41))
+    rng = random.Random(3)
+    active = list(range(1, 41))
+    while len(active) > 1:
+        winner, loser = rng.sample(active, 2)
+        manager.process_knockout(winner, loser)
+        active.remove(loser)
+        stacks = {p.id: p.chips for p in manager.players.active()}
+        assert manager.chips.total_chips == 40 * 5000
+        check(manager.chips, stacks)
+    assert manager.get_chip_leaders(1)[0][1] == 40 * 5000
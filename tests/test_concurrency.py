@@ -0,0 +1,51 @@
+import os
+import sys
+import threading
+
+from event_journal import EventJournal
+from tournament_types import TournamentType
+
+def test_concurrent_operations_journal_whole_frames(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(TournamentType.REGULAR, journal=EventJournal(path, snapshot_interval=250),
+                           starting_stack=10_000)
+    count = 3000
+    errors = []
+
+    def change_levels():
+        try:
+            for i in range(count):
+                manager.set_level(i % 4)
+        except Exception as e:
+            errors.append(e)
+
+    def register():
+        try:
+            for i in range(count):
+                manager.add_player(f"Player {i}")
+        except Exception as e:
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=change_levels), threading.Thread(target=register)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    manager.journal.close()
+    assert not errors
+
+    expected = [(p.id, p.name, p.chips) for p in manager.players.values()]
+    assert len(expected) == count
+    for snapshot in (True, False):
+        if not snapshot:
+            os.remove(path + '.snapshot')
+        restored = make_manager(TournamentType.REGULAR, journal=EventJournal(path))
+        restored.restore()
+        assert [(p.id, p.name, p.chips) for p in restored.players.values()] == expected
+        assert restored.current_level == manager.current_level
+        assert restored.prize_pool_cents == manager.prize_pool_cents
@@ -0,0 +1,90 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from tournament_manager import _PrefixCredits
+from tournament_types import Knockout, MultiwayAllInResult, PayoutStructure, TournamentType
+
+def test_prefix_credits_split_is_exact():
+    credits = _PrefixCredits(7)
+    credits.split(101, 3)  # 34, 34, 33
+    credits.add(5, 10)
+    assert [credits.at(i) for i in range(7)] == [44, 44, 43, 10, 10, 0, 0]
+    assert sum(credits.at(i) for i in range(7)) == 101 + 50
+
+def test_batch_is_all_or_nothing(make_manager):
+    manager = make_manager()
+    manager.register_players(f"P{i}" for i in range(1, 6))
+    before = [(p.bounty_cents, p.bounty_won_cents, p.eliminated) for p in manager.players.values()]
+    with pytest.raises(ValueError):
+        # The second knockout reuses a player the first one eliminated
+        manager.process_eliminations([Knockout(1, 2), Knockout(2, 3)])
+    assert [(p.bounty_cents, p.bounty_won_cents, p.eliminated) for p in manager.players.values()] == before
+    assert manager.get_remaining_players() == 5
+
+def test_batch_matches_sequential_calls(make_manager):
+    batched = make_manager()
+    sequential = make_manager()
+    for manager in (batched, sequential):
+        manager.register_players(f"P{i}" for i in range(1, 9))
+    players = batched.players
+    items = [Knockout(1, 2),
+             MultiwayAllInResult([players[3], players[4], players[5]], {3: 1, 4: 2, 5: 3}),
+             Knockout(3, 6)]
+    batched.process_eliminations(items)
+    sequential.process_knockout(1, 2)
+    sequential.process_multiway_allin(
+        MultiwayAllInResult([sequential.players[i] for i in (3, 4, 5)], {3: 1, 4: 2, 5: 3}))
+    sequential.process_knockout(3, 6)
+    key = lambda m: [(p.bounty_cents, p.bounty_won_cents, p.position) for p in m.players.values()]
+    assert key(batched) == key(sequential)
+
+def _naive_multiway(bounties, positions, active):
+    """Reference resolution: settle pot positions worst first, one player at a time"""
+    bounties = dict(bounties)
+    won = {player_id: 0 for player_id in bounties}
+    places = {}
+    for position in sorted(set(positions.values()), reverse=True)[:-1]:
+        group = [p for p in bounties if positions[p] == position]
+        ahead = sorted((p for p in bounties if positions[p] < position), key=lambda p: (positions[p], p))
+        for player_id in sorted(group):
+            immediate, added = -(-bounties[player_id] // 2), bounties[player_id] // 2
+            for i, p in enumerate(ahead):
+                won[p] += immediate // len(ahead) + (1 if i < immediate % len(ahead) else 0)
+                bounties[p] += added // len(ahead) + (1 if i < added % len(ahead) else 0)
+            bounties[player_id] = 0
+        for player_id in group:
+            places[player_id] = active - len(group) + 1
+        active -= len(group)
+    return bounties, won, places
+
+def test_multiway_matches_reference(make_manager):
+    rng = random.Random(4)
+    winner_takes_all = [PayoutStructure({1: Decimal('1')}, 2)]
+    for _ in range(200):
+        manager = make_manager(payout_structures=winner_takes_all)
+        manager.register_players(f"P{i}" for i in range(1, 13))
+        for player in manager.players.values():
+            player.bounty_cents = rng.randint(1, 20_000)
+        ids = rng.sample(range(1, 13), rng.randint(2, 6))
+        positions = {ids[0]: 1}
+        positions.update((player_id, rng.randint(1, len(ids))) for player_id in ids[1:])
+        expected_bounties, expected_won, expected_places = _naive_multiway(
+            {i: manager.players[i].bounty_cents for i in ids}, positions, 12)
+
+        manager.process_multiway_allin(MultiwayAllInResult([manager.players[i] for i in ids], positions))
+        for player_id in ids:
+            player = manager.players[player_id]
+            assert player.bounty_won_cents == expected_won[player_id]
+            assert player.bounty_cents == expected_bounties[player_id]
+            assert player.position == expected_places.get(player_id)
+
+def test_multiway_eliminates_in_regular_events(make_manager):
+    manager = make_manager(TournamentType.REGULAR)
+    manager.register_players(['a', 'b', 'c', 'd'])
+    players = manager.players
+    manager.process_multiway_allin(MultiwayAllInResult([players[1], players[2], players[3]],
+                                                       {1: 1, 2: 2, 3: 2}))
+    assert manager.get_remaining_players() == 2
+    assert players[2].position == players[3].position == 3
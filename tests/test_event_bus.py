@@ -0,0 +1,106 @@
+import threading
+from collections import Counter
+
+import pytest
+
+from event_bus import ChangeType, EventBus
+from tournament_types import MultiwayAllInResult, TournamentType
+
+def recorder(bus, *change_types):
+    received = []
+    for change_type in change_types:
+        bus.subscribe(change_type, received.append)
+    return received
+
+def test_emit_without_batch_delivers_at_once():
+    bus = EventBus()
+    received = recorder(bus, ChangeType.LEVEL_CHANGED)
+    bus.emit(ChangeType.LEVEL_CHANGED, 1)
+    bus.emit(ChangeType.PRIZE_POOL_CHANGED, 100)  # nobody listens
+    assert [(e.type, e.value) for e in received] == [(ChangeType.LEVEL_CHANGED, 1)]
+    assert bus.wants(ChangeType.LEVEL_CHANGED) and not bus.wants(ChangeType.PRIZE_POOL_CHANGED)
+
+def test_batch_keeps_the_latest_value_per_type_and_key():
+    bus = EventBus()
+    received = recorder(bus, ChangeType.BOUNTY_UPDATED, ChangeType.LEVEL_CHANGED)
+    with bus.batch():
+        bus.emit(ChangeType.BOUNTY_UPDATED, 10, key=1)
+        bus.emit(ChangeType.BOUNTY_UPDATED, 20, key=2)
+        bus.emit(ChangeType.LEVEL_CHANGED, 3)
+        bus.emit(ChangeType.BOUNTY_UPDATED, 30, key=1)
+        assert received == []
+    assert [(e.type, e.key, e.value) for e in received] == [
+        (ChangeType.BOUNTY_UPDATED, 2, 20),
+        (ChangeType.LEVEL_CHANGED, None, 3),
+        (ChangeType.BOUNTY_UPDATED, 1, 30),
+    ]
+
+def test_nested_batches_deliver_when_the_outermost_ends():
+    bus = EventBus()
+    received = recorder(bus, ChangeType.LEVEL_CHANGED)
+    with bus.batch():
+        with bus.batch():
+            bus.emit(ChangeType.LEVEL_CHANGED, 1)
+        assert received == []
+        bus.emit(ChangeType.LEVEL_CHANGED, 2)
+    assert [e.value for e in received] == [2]
+
+def test_batch_delivers_even_when_the_block_fails():
+    bus = EventBus()
+    received = recorder(bus, ChangeType.LEVEL_CHANGED)
+    with pytest.raises(RuntimeError):
+        with bus.batch():
+            bus.emit(ChangeType.LEVEL_CHANGED, 1)
+            raise RuntimeError
+    assert [e.value for e in received] == [1]
+    bus.emit(ChangeType.LEVEL_CHANGED, 2)  # no batch left open
+    assert [e.value for e in received] == [1, 2]
+
+def test_pending_events_are_per_thread():
+    bus = EventBus()
+    received = recorder(bus, ChangeType.LEVEL_CHANGED)
+    with bus.batch():
+        bus.emit(ChangeType.LEVEL_CHANGED, 1)
+        thread = threading.Thread(target=bus.emit, args=(ChangeType.LEVEL_CHANGED, 2))
+        thread.start()
+        thread.join()
+        assert [e.value for e in received] == [2]
+    assert [e.value for e in received] == [2, 1]
+
+def test_unsubscribe():
+    bus = EventBus()
+    first, second = [], []
+    bus.subscribe(ChangeType.LEVEL_CHANGED, first.append)
+    bus.subscribe(ChangeType.LEVEL_CHANGED, second.append)
+    bus.unsubscribe(ChangeType.LEVEL_CHANGED, first.append)
+    bus.emit(ChangeType.LEVEL_CHANGED, 1)
+    assert (len(first), len(second)) == (0, 1)
+    bus.unsubscribe(ChangeType.LEVEL_CHANGED, second.append)
+    assert not bus.has_listeners()
+    bus.emit(ChangeType.LEVEL_CHANGED, 2)
+    assert len(second) == 1
+
+def test_one_operation_is_one_coalesced_burst(make_manager):
+    manager = make_manager(TournamentType.PKO, starting_stack=1000)
+    players = manager.register_players(f"P{i}" for i in range(1, 7))
+    seen = []
+
+    def listener(event):
+        # Remaining players at delivery time: the whole operation has applied
+        seen.append((event, manager.players.active_count))
+
+    for change_type in ChangeType:
+        manager.events.subscribe(change_type, listener)
+    result = MultiwayAllInResult(players[:4], {1: 1, 2: 2, 3: 3, 4: 3})
+    manager.process_multiway_allin(result)
+
+    assert {remaining for _, remaining in seen} == {3}
+    events = [event for event, _ in seen]
+    counts = Counter((e.type, e.key) for e in events)
+    assert max(counts.values()) == 1
+    assert counts[(ChangeType.PLAYERS_REMAINING_CHANGED, None)] == 1
+    assert {e.key for e in events if e.type == ChangeType.PLAYER_ELIMINATED} == {2, 3, 4}
+    remaining = [e.value for e in events if e.type == ChangeType.PLAYERS_REMAINING_CHANGED]
+    assert remaining == [manager.get_remaining_players()] == [3]
+    bounties = {e.key: e.value for e in events if e.type == ChangeType.BOUNTY_UPDATED}
+    assert bounties[1] == manager.players[1].bounty_cents
@@ -0,0 +1,108 @@
+import os
+from decimal import Decimal
+
+from event_journal import EventJournal
+from tournament_types import BlindLevel, TournamentType
+
+def state(manager):
+    players = [(p.id, p.name, p.bounty_cents, p.bounty_won_cents, p.eliminated, p.position, p.chips)
+               for p in manager.players.values()]
+    return (players, manager.prize_pool_cents, manager.current_level, manager.hand_for_hand,
+            manager.players.next_id)
+
+def play(manager):
+    manager.register_players(f"Player {i}" for i in range(1, 31))
+    manager.process_knockout(1, 2)
+    manager.update_chip_counts({3: 12_000, 4: 8_000})
+    manager.set_level(3)
+    manager.set_hand_for_hand(True)
+    for loser in range(5, 12):
+        manager.process_knockout(3, loser)
+
+def test_restore_replays_journal(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(journal=EventJournal(path, snapshot_interval=0), starting_stack=10_000)
+    play(manager)
+    manager.journal.close()
+
+    restored = make_manager(journal=EventJournal(path), starting_stack=10_000)
+    restored.restore()
+    assert state(restored) == state(manager)
+    assert restored.chips.top(5) == manager.chips.top(5)
+
+def test_restore_from_snapshot_and_tail(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(journal=EventJournal(path, snapshot_interval=4), starting_stack=10_000)
+    play(manager)
+    manager.journal.close()
+    assert os.path.exists(path + '.snapshot')
+
+    restored = make_manager(journal=EventJournal(path), starting_stack=10_000)
+    replayed = restored.restore()
+    assert replayed < 4
+    assert state(restored) == state(manager)
+
+def test_torn_frame_is_truncated(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(journal=EventJournal(path, snapshot_interval=0))
+    manager.register_players(['a', 'b', 'c'])
+    manager.journal.close()
+    intact = os.path.getsize(path)
+    expected = state(manager)
+    manager.process_knockout(1, 2)
+    manager.journal.close()
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 3)
+
+    restored = make_manager(journal=EventJournal(path))
+    restored.restore()
+    assert state(restored) == expected
+    assert os.path.getsize(path) == intact
+
+def test_restore_applies_recorded_configuration(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(TournamentType.PKO, buy_in='220', bounty='55',
+                           journal=EventJournal(path, snapshot_interval=2),
+                           starting_stack=25_000, late_registration_levels=6)
+    manager.register_players(['a', 'b', 'c'])
+    manager.journal.close()
+
+    restored = make_manager(TournamentType.REGULAR, journal=EventJournal(path))
+    restored.restore()
+    assert restored.tournament_type == TournamentType.PKO
+    assert restored.buy_in == Decimal('220')
+    assert restored.bounty_amount == Decimal('55')
+    assert restored.starting_stack == 25_000
+    assert restored.late_registration_levels == 6
+
+def test_replanned_structure_survives_restore(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(journal=EventJournal(path, snapshot_interval=0))
+    manager.register_players(['a', 'b'])
+    manager.set_level(2)
+    structure = [BlindLevel(100, 200, 0, 30), BlindLevel(150, 300, 0, 30),
+                 BlindLevel(200, 400, 50, 30), BlindLevel(200, 400, 50, 10, is_break=True)]
+    manager.set_blind_structure(structure)
+    manager.journal.close()
+
+    restored = make_manager(journal=EventJournal(path))
+    restored.restore()
+    assert restored.blind_structure == structure
+    # 75/150 carries on at the closest big blind, 100/200
+    assert restored.current_level == manager.current_level == 0
+    assert restored.get_current_level_info() == structure[0]
+    assert restored.clock.state().remaining_seconds == 30 * 60
+
+def test_restore_without_snapshot_replaces_existing_state(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(journal=EventJournal(path, snapshot_interval=0), starting_stack=10_000)
+    play(manager)
+    manager.journal.close()
+
+    restored = make_manager(starting_stack=10_000)
+    restored.register_players(f"Walk-in {i}" for i in range(40))
+    restored.set_level(5)
+    restored.journal = EventJournal(path)
+    restored.restore()
+    assert state(restored) == state(manager)
+    assert restored.chips.total_chips == manager.chips.total_chips
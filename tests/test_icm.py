@@ -0,0 +1,65 @@
+import itertools
+
+import pytest
+
+from icm import calculate_deal, icm_exact, icm_monte_carlo
+
+def brute_force(stacks, payouts):
+    equities = [0.0] * len(stacks)
+    for order in itertools.permutations(range(len(stacks))):
+        probability = 1.0
+        left = sum(stacks)
+        for player in order:
+            probability *= stacks[player] / left
+            left -= stacks[player]
+        for place, player in enumerate(order[:len(payouts)]):
+            equities[player] += probability * payouts[place]
+    return equities
+
+def test_exact_matches_brute_force():
+    stacks = [5000, 3000, 1500, 500, 2500]
+    payouts = [500, 300, 200]
+    assert icm_exact(stacks, payouts) == pytest.approx(brute_force(stacks, payouts))
+
+def test_deal_sums_to_remaining_prizes(make_manager):
+    manager = make_manager(starting_stack=10_000)
+    manager.register_players(f"P{i}" for i in range(1, 11))
+    for loser in range(6, 11):
+        manager.process_knockout(1, loser)
+    deal = calculate_deal(manager)
+    prizes = sum(manager.calculate_prize(place) or 0 for place in range(1, 6))
+    bounties = sum(p.bounty for p in manager.players.active())
+    assert sum(d.icm_equity for d in deal.values()) == prizes
+    assert sum(d.total for d in deal.values()) == prizes + bounties
+
+def test_deal_without_chips_is_rejected(make_manager):
+    manager = make_manager()
+    manager.register_players(f"P{i}" for i in range(1, 6))
+    with pytest.raises(ValueError):
+        calculate_deal(manager)
+
+def test_players_without_chips_share_the_bottom_places():
+    payouts = [500, 300, 120, 80]
+    equities = icm_exact([8000, 2000, 0, 0], payouts)
+    assert equities[2] == equities[3] == 100
+    assert sum(equities) == pytest.approx(1000)
+    assert equities[:2] == pytest.approx(icm_exact([8000, 2000], payouts[:2]))
+
+def test_deal_with_a_zero_stack_pays_the_remaining_prizes(make_manager):
+    manager = make_manager(starting_stack=10_000)
+    manager.register_players(f"P{i}" for i in range(1, 11))
+    for loser in range(4, 11):
+        manager.process_knockout(1, loser)
+    deal = calculate_deal(manager, {1: 8000, 2: 2000, 3: 0})
+    prizes = sum(manager.calculate_prize(place) or 0 for place in range(1, 4))
+    assert sum(d.icm_equity for d in deal.values()) == prizes
+    assert deal[3].icm_equity == manager.calculate_prize(3)
+    assert deal[3].bounty_equity == 0
+    with pytest.raises(ValueError):
+        calculate_deal(manager, {1: 8000, 2: -1})
+
+def test_monte_carlo_gives_zero_stacks_the_bottom_places():
+    pytest.importorskip('numpy')
+    equities = icm_monte_carlo([8000, 2000, 0], [600, 300, 100], trials=20_000, seed=1)
+    assert equities[2] == 100
+    assert sum(equities) == pytest.approx(1000)
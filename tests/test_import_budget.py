@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_headless_import_within_budget(monkeypatch, capsys):
+    monkeypatch.chdir(ROOT)
+    assert cli.main(['check-imports', '--runs', '3']) == 0
+    assert "no Qt loaded" in capsys.readouterr().out
+
+def test_headless_modules_never_import_qt():
+    # Poisoned entries make any PyQt import fail, even where PyQt is installed
+    code = (
+        "import sys\n"
+        "for name in ('PyQt6', 'PyQt6.QtCore', 'PyQt6.QtWidgets', 'PyQt6.QtGui'): sys.modules[name] = None\n"
+        f"for name in {cli.HEADLESS_MODULES!r}: __import__(name)\n"
+        "print(sorted(m for m in sys.modules if m.startswith('PyQt') and sys.modules[m] is not None))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '[]'
@@ -0,0 +1,133 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from instrumentation import (MANAGER_OPERATIONS, Instrumentation, Metrics, MetricsServer, instrument,
+                             instrument_display, uninstrument, uninstrument_display)
+
+class Signal:
+    """Stands in for a Qt signal, which keeps the bound methods it was connected to"""
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot):
+        self.slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self.slots):
+            slot(*args)
+
+class Timer:
+    def __init__(self):
+        self.timeout = Signal()
+
+class Window:
+    def __init__(self):
+        self.change_received = Signal()
+        self.clock_timer = Timer()
+        self.change_received.connect(self.on_change)
+        self.clock_timer.timeout.connect(self.update_time)
+
+    def update_display(self):
+        pass
+
+    def on_change(self, event):
+        pass
+
+    def update_time(self):
+        pass
+
+def test_display_slots_are_timed_through_their_signals():
+    window = Window()
+    metrics = Metrics()
+    instrument_display(window, metrics)
+    window.update_display()
+    window.change_received.emit(None)
+    for _ in range(3):
+        window.clock_timer.timeout.emit()
+    assert metrics.histogram('display_update_display').count == 1
+    assert metrics.histogram('display_on_change').count == 1
+    assert metrics.histogram('display_update_time').count == 3
+
+    uninstrument_display(window)
+    window.clock_timer.timeout.emit()
+    window.change_received.emit(None)
+    assert metrics.histogram('display_update_time').count == 3
+    assert metrics.histogram('display_on_change').count == 1
+    assert len(window.clock_timer.timeout.slots) == len(window.change_received.slots) == 1
+
+def test_close_restores_manager_and_display(make_manager):
+    manager = make_manager()
+    window = Window()
+    instrumentation = Instrumentation(manager, window)
+    manager.add_player("A")
+    window.clock_timer.timeout.emit()
+    instrumentation.close()
+    assert instrumentation.metrics.histogram('add_player').count == 1
+    assert instrumentation.metrics.histogram('display_update_time').count == 1
+    assert 'add_player' not in manager.__dict__
+    assert 'update_time' not in window.__dict__
+
+def test_nested_operations_are_counted_once(make_manager):
+    manager = make_manager()
+    metrics = Metrics()
+    instrument(manager, metrics, MANAGER_OPERATIONS)
+    for i in range(3):
+        manager.add_player(f"P{i}")
+    manager.register_players(["Q1", "Q2"])
+    assert metrics.histogram('add_player').count == 3
+    assert metrics.histogram('register_players').count == 1
+    uninstrument(manager, MANAGER_OPERATIONS)
+
+def parse(text):
+    """{(name, frozenset of labels): value} for every sample line of a text exposition"""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith('#') or not line:
+            continue
+        series, value = line.rsplit(' ', 1)
+        name, labels = series.rstrip('}').split('{')
+        samples[(name, frozenset(labels.split(',')))] = float(value)
+    return samples
+
+def test_prometheus_text_is_a_valid_histogram(tmp_path):
+    metrics = Metrics(buckets=(0.001, 0.01, 0.1))
+    for seconds in (0.0005, 0.002, 0.002, 0.05, 3.0):
+        metrics.observe('add_player', seconds)
+    text = metrics.prometheus_text()
+    assert text.startswith("# HELP tournament_operation_seconds")
+    assert "# TYPE tournament_operation_seconds histogram" in text
+    samples = parse(text)
+    op = 'operation="add_player"'
+    buckets = [samples[('tournament_operation_seconds_bucket', frozenset([op, f'le="{le}"']))]
+               for le in ('0.001', '0.01', '0.1', '+Inf')]
+    assert buckets == [1, 3, 4, 5]
+    assert samples[('tournament_operation_seconds_count', frozenset([op]))] == 5
+    assert samples[('tournament_operation_seconds_sum', frozenset([op]))] == pytest.approx(3.0545)
+
+    path = str(tmp_path / 'metrics.prom')
+    metrics.dump(path)
+    with open(path) as f:
+        assert f.read() == text
+
+def test_metrics_server_serves_metrics():
+    metrics = Metrics()
+    metrics.observe('calculate_prize', 0.0001)
+    server = MetricsServer(metrics, port=0)
+    server.start()
+    try:
+        url = f"http://127.0.0.1:{server.port}"
+        with urllib.request.urlopen(url + '/metrics') as response:
+            assert response.headers['Content-Type'].startswith('text/plain')
+            body = response.read().decode('utf-8')
+        assert body == metrics.prometheus_text()
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(url + '/other')
+        assert error.value.code == 404
+    finally:
+        server.stop()
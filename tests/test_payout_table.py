@@ -0,0 +1,32 @@
+from decimal import Decimal
+
+from money import to_cents
+from payout_engine import PayoutTable, generate_payout_structure
+from tournament_types import PayoutStructure
+
+def test_generated_structure_sums_to_one():
+    for field_size in (10, 60, 1000, 50_000):
+        structure = generate_payout_structure(field_size)
+        assert sum(structure.positions.values()) == Decimal('1')
+
+def test_editing_returned_structures_does_not_affect_payouts(make_manager):
+    manager = make_manager()
+    manager.register_players(f"P{i}" for i in range(10))
+    before = manager.get_payout_board()
+    structures = manager.payout_structures
+    structures.clear()
+    manager.payout_structures[0].positions[1] = Decimal('0.99')
+    assert manager.get_payout_board() == before
+
+def test_assigning_structures_rebuilds_the_table(make_manager):
+    manager = make_manager()
+    manager.register_players(f"P{i}" for i in range(10))
+    manager.payout_structures = [PayoutStructure({1: Decimal('0.6'), 2: Decimal('0.4')}, 2)]
+    assert manager.get_payout_board() == [(1, Decimal('600.00')), (2, Decimal('400.00'))]
+
+def test_table_copies_structures():
+    original = PayoutStructure({1: Decimal('1')}, 2)
+    table = PayoutTable([original])
+    assert table.prize(5, to_cents(Decimal('100')), 1) == 10_000
+    original.positions[1] = Decimal('0.5')
+    assert table.prize(5, to_cents(Decimal('100')), 1) == 10_000
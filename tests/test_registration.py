@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+import cli
+from event_journal import EventJournal
+from registration_import import import_registrations, read_names
+from service import TournamentService
+from tournament_types import BlindLevel, TournamentType
+
+def blinds(levels=4):
+    return [BlindLevel(25 * 2 ** i, 50 * 2 ** i, 0, 20) for i in range(levels)]
+
+def test_remove_entry_refunds_untouched_entries(make_manager):
+    manager = make_manager(TournamentType.PKO, starting_stack=1000)
+    manager.register_players(["A", "B", "C"])
+    assert manager.remove_entry(3) == 150
+    assert manager.prize_pool_cents == 20_000
+    assert 3 not in manager.chips
+
+def test_remove_entry_rejects_played_stacks(make_manager):
+    manager = make_manager(TournamentType.PKO, starting_stack=1000)
+    manager.register_players(["A", "B", "C"])
+    manager.update_chip_counts({1: 1500, 2: 500})
+    for player_id in (1, 2):
+        with pytest.raises(ValueError):
+            manager.remove_entry(player_id)
+    manager.rebuy(3)
+    with pytest.raises(ValueError):
+        manager.remove_entry(3)
+    assert manager.players.active_count == 3
+
+def test_remove_entry_rejected_after_registration_closes(make_manager):
+    manager = make_manager(TournamentType.REGULAR, blind_structure=blinds(),
+                           starting_stack=1000, late_registration_levels=2)
+    manager.register_players(["A", "B"])
+    manager.set_level(2)
+    with pytest.raises(ValueError):
+        manager.remove_entry(1)
+
+def test_each_busted_entry_reenters_once(tmp_path, make_manager):
+    path = str(tmp_path / 'event.log')
+    manager = make_manager(TournamentType.PKO, starting_stack=1000,
+                           journal=EventJournal(path, snapshot_interval=0))
+    manager.register_players(["A", "B", "C"])
+    manager.process_knockout(1, 2)
+    second = manager.reenter(2)
+    with pytest.raises(ValueError):
+        manager.reenter(2)
+    manager.process_knockout(1, second.id)
+    manager.reenter(second.id)
+    assert manager.prize_pool_cents == 50_000
+    manager.journal.close()
+
+    for snapshot in (False, True):
+        journal = EventJournal(path, snapshot_interval=0)
+        restored = make_manager(TournamentType.PKO, journal=journal)
+        restored.restore()
+        assert [p.reentered for p in restored.players.values()] == [False, True, False, True, False]
+        with pytest.raises(ValueError):
+            restored.reenter(2)
+        journal.snapshot(restored)
+        journal.close()
+
+def test_import_validates_the_whole_file_first(tmp_path, make_manager):
+    path = tmp_path / 'entries.jsonl'
+    lines = [json.dumps({'name': f"Player {i}"}) for i in range(25)]
+    lines.insert(20, json.dumps({'seat': 3}))
+    path.write_text('\n'.join(lines) + '\n')
+    manager = make_manager(TournamentType.REGULAR)
+    with pytest.raises(ValueError):
+        import_registrations(manager, str(path), batch_size=5)
+    assert len(manager.players) == 0
+    assert manager.prize_pool_cents == 0
+
+def test_import_registers_in_batches(tmp_path, make_manager):
+    path = tmp_path / 'entries.csv'
+    path.write_text("name,email\n" + ''.join(f"Player {i},p{i}@example.com\n" for i in range(12)))
+    manager = make_manager(TournamentType.REGULAR)
+    players = import_registrations(manager, str(path), batch_size=5)
+    assert [p.name for p in players] == [f"Player {i}" for i in range(12)]
+    assert manager.prize_pool_cents == 120_000
+
+def test_csv_needs_a_name_column(tmp_path):
+    path = tmp_path / 'entries.csv'
+    path.write_text("Player Name,Email\nAnn,ann@example.com\n")
+    assert list(read_names(str(path))) == ["Ann"]
+    path.write_text("Full,Email\nAnn,ann@example.com\n")
+    with pytest.raises(ValueError, match="name column"):
+        list(read_names(str(path)))
+
+@pytest.mark.parametrize('line', ['42', '["Ann"]', '{"name": 7}', '{"name": "Ann"'])
+def test_bad_jsonl_lines_report_their_line(tmp_path, line):
+    path = tmp_path / 'entries.jsonl'
+    path.write_text('"Bob"\n' + line + '\n')
+    with pytest.raises(ValueError, match=r"entries\.jsonl:2"):
+        list(read_names(str(path)))
+
+def test_cli_register_journals_the_stack_and_late_registration(tmp_path, capsys):
+    entries = tmp_path / 'entries.csv'
+    entries.write_text("name\nAnn\nBob\n")
+    journal = str(tmp_path / 'event.log')
+    assert cli.main(['register', '--journal', journal, '--file', str(entries),
+                     '--stack', '25000', '--late-reg', '6']) == 0
+    assert cli.main(['status', '--journal', journal]) == 0
+    status = json.loads(capsys.readouterr().out.split('\n', 1)[1])
+    assert status['entries'] == 2
+    assert status['total_chips'] == 50_000
+    restored = TournamentService.create(journal_path=journal)
+    assert (restored.manager.starting_stack, restored.manager.late_registration_levels) == (25_000, 6)
+    restored.close()
@@ -0,0 +1,37 @@
+from decimal import Decimal
+
+from results_store import ResultsStore
+from simulation import TournamentSimulator
+from tournament_types import MultiwayAllInResult, PayoutStructure, TournamentType
+
+def exported_prizes(store, tournament_id):
+    return dict(store.connection.execute(
+        "SELECT player_name, prize_cents FROM results WHERE tournament_id = ?", (tournament_id,)))
+
+def test_tied_players_share_their_places(tmp_path, make_manager):
+    structure = PayoutStructure({1: Decimal('0.5'), 2: Decimal('0.3'), 3: Decimal('0.2')}, 2)
+    manager = make_manager(TournamentType.REGULAR, payout_structures=[structure], starting_stack=1000)
+    players = manager.register_players(f"P{i}" for i in range(1, 11))
+    winner = players[0]
+    for loser in players[3:]:
+        manager.process_multiway_allin(MultiwayAllInResult([winner, loser], {winner.id: 1, loser.id: 2}))
+    manager.process_multiway_allin(MultiwayAllInResult(
+        players[:3], {winner.id: 1, players[1].id: 2, players[2].id: 2}))
+
+    store = ResultsStore(str(tmp_path / 'results.db'))
+    prizes = exported_prizes(store, store.record_tournament(manager, "Tie"))
+    assert prizes['P1'] == 50_000
+    assert prizes['P2'] == prizes['P3'] == 25_000
+    assert sum(prizes.values()) == manager.prize_pool_cents
+    store.close()
+
+def test_exported_prizes_sum_to_the_pool(tmp_path):
+    manager = TournamentSimulator(1500, seed=3, multiway_rate=0.3).run().manager
+    store = ResultsStore(str(tmp_path / 'results.db'))
+    tournament_id = store.record_tournament(manager, "Simulated", series="Series")
+    total, = store.connection.execute(
+        "SELECT SUM(prize_cents) FROM results WHERE tournament_id = ?", (tournament_id,)).fetchone()
+    assert total == manager.prize_pool_cents
+    leaderboard = store.series_leaderboard("Series", limit=10_000)
+    assert sum(prizes for _, prizes, _, _ in leaderboard) == manager.total_prize_pool
+    store.close()
@@ -0,0 +1,66 @@
+import random
+
+from seating import SeatingEngine
+from tournament_types import TournamentType
+
+def check_room(engine):
+    counts = engine.table_counts()
+    assert max(counts.values()) - min(counts.values()) <= 1
+    assert len(counts) == max(1, -(-len(engine) // engine.table_size))
+    for player_id, (table_id, seat) in engine.seat_of.items():
+        assert engine.tables[table_id].seats[seat] == player_id
+    for table in engine.tables.values():
+        assert table.count == sum(p is not None for p in table.seats)
+
+def apply(seats, moves):
+    for move in moves:
+        if move.from_table is not None:
+            assert seats.get(move.player_id) == (move.from_table, move.from_seat)
+        seats[move.player_id] = (move.to_table, move.to_seat)
+
+def test_draw_is_balanced():
+    for players in (1, 9, 10, 17, 100, 1001):
+        engine = SeatingEngine(table_size=9, seed=players)
+        moves = engine.draw(range(players))
+        assert sorted(move.player_id for move in moves) == list(range(players))
+        check_room(engine)
+
+def test_bust_outs_keep_tables_balanced():
+    rng = random.Random(5)
+    engine = SeatingEngine(table_size=9, final_table_size=9, seed=5)
+    seats = {}
+    apply(seats, engine.draw(range(300)))
+    left = list(range(300))
+    while len(left) > 1:
+        busted = [left.pop(rng.randrange(len(left))) for _ in range(min(rng.randint(1, 3), len(left) - 1))]
+        for player_id in busted:
+            del seats[player_id]
+        apply(seats, engine.remove_players(busted))
+        assert seats == engine.seat_of
+        if len(left) > 9:
+            check_room(engine)
+        else:
+            assert engine.final_table_drawn
+            assert len(engine.tables) == 1
+
+def test_late_registrations_and_break_order():
+    engine = SeatingEngine(table_size=6, break_order=[2, 3, 1], seed=1)
+    engine.draw(range(12))
+    engine.seat_players(range(12, 18))
+    check_room(engine)
+    engine.remove_players(range(6))
+    assert set(engine.tables) == {1, 3}
+    engine.remove_players(range(6, 12))
+    assert set(engine.tables) == {1}
+
+def test_manager_reseats_on_registration_and_elimination(make_manager):
+    manager = make_manager(TournamentType.PKO, starting_stack=1000)
+    manager.register_players(f"P{i}" for i in range(1, 28))
+    manager.start_seating(table_size=9, seed=2)
+    manager.register_players(["Late"])
+    for loser in range(2, 12):
+        manager.process_knockout(1, loser)
+    moves = manager.take_seat_moves()
+    assert moves
+    assert set(manager.seating.seat_of) == {p.id for p in manager.players.active()}
+    check_room(manager.seating)
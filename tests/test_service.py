@@ -0,0 +1,75 @@
+from decimal import Decimal
+from time import sleep
+
+import pytest
+
+import cli
+from service import TournamentService
+from tournament_types import BlindLevel, TournamentType
+
+def test_run_clock_advances_levels_without_a_display():
+    service = TournamentService.create(blind_structure=[BlindLevel(25, 50, 0, 1), BlindLevel(50, 100, 0, 1)])
+    scheduler = service.run_clock()
+    assert service.run_clock() is scheduler
+    service.start_clock()
+    service.manager.adjust_clock(-59.95)
+    for _ in range(200):
+        if service.status()['level'] == 2:
+            break
+        sleep(0.01)
+    assert service.status()['level'] == 2
+    service.close()
+    assert len(scheduler) == 0
+
+def test_replan_continues_from_the_current_blinds():
+    service = TournamentService.create(starting_stack=20_000)
+    service.register(f"Player {i}" for i in range(300))
+    service.manager.set_level(9)  # 600/1200, three hours in
+    before = service.manager.blind_structure[:9]
+    plan = service.replan(480, max_workers=1, trials=40)
+    manager = service.manager
+    level = manager.get_current_level_info()
+    assert manager.current_level == 9
+    assert (level.is_break, level.big_blind) == (False, 1200)
+    assert manager.blind_structure[:9] == before
+    assert manager.blind_structure[9:] == plan.structure
+    # Planned for the five hours left
+    assert abs(plan.p50_minutes - 300) < abs(plan.p50_minutes - 480)
+
+def test_new_structure_keeps_the_closest_big_blind(make_manager):
+    manager = make_manager(TournamentType.REGULAR)
+    manager.set_level(9)  # 600/1200
+    structure = [BlindLevel(500, 1000, 0, 15), BlindLevel(500, 1000, 0, 10, is_break=True),
+                 BlindLevel(600, 1200, 100, 15), BlindLevel(1000, 2000, 200, 15)]
+    manager.set_blind_structure(structure)
+    assert manager.current_level == 2
+
+def test_pko_without_bounty_is_rejected(capsys):
+    with pytest.raises(ValueError, match="bounty"):
+        TournamentService.create('pko')
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(['payouts', '--type', 'pko', '--entries', '10'])
+    assert exit_info.value.code == 2
+    assert "bounty" in capsys.readouterr().err
+
+def test_pko_event_through_the_service(tmp_path):
+    journal = str(tmp_path / 'event.log')
+    service = TournamentService.create('pko', Decimal('100'), Decimal('50'), journal_path=journal,
+                                       starting_stack=10_000)
+    ids = service.register(f"P{i}" for i in range(1, 11))
+    assert service.knockout(ids[0], ids[1]) == Decimal('25')
+    service.rebuy(ids[2])
+    assert service.reenter(ids[1]) == 11
+    assert service.multiway({ids[0]: 1, ids[3]: 2, ids[4]: 2}) == {ids[0]: Decimal('50')}
+    service.chip_counts({ids[5]: 12_345})
+    assert ('P6', 12_345) in service.chip_leaders(10)
+    assert service.remove_entry(ids[9]) == Decimal('150')
+    status = service.status()
+    assert (status['entries'], status['remaining'], status['prize_pool']) == (10, 7, '1100.00')
+    assert status['total_chips'] == 11 * 10_000 + 2_345  # the recount added chips
+    assert sum(prize for _, prize in service.payouts()) == Decimal('1100.00')
+    service.close()
+
+    restored = TournamentService.create(journal_path=journal)
+    assert restored.status() == status
+    restored.close()
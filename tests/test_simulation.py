@@ -0,0 +1,21 @@
+from decimal import Decimal
+
+from simulation import TournamentSimulator, check_invariants
+from tournament_types import TournamentType
+
+def test_simulated_events_keep_invariants():
+    for seed, tournament_type in ((1, TournamentType.PKO), (2, TournamentType.REGULAR)):
+        result = TournamentSimulator(600, tournament_type, seed=seed, multiway_rate=0.3).run()
+        assert result.violations == []
+        assert sum(result.prizes.values()) == result.manager.total_prize_pool
+
+def test_overpaid_ties_are_reported():
+    manager = TournamentSimulator(600, seed=1, multiway_rate=0.3).run().manager
+    # Each tied player priced at their place alone, as if nobody shared it
+    prizes = {}
+    for player in manager.players.values():
+        prize = manager.calculate_prize(player.position if player.eliminated else 1)
+        if prize:
+            prizes[player.id] = prize
+    assert sum(prizes.values()) != manager.total_prize_pool
+    assert any("tied" in violation for violation in check_invariants(manager, prizes))
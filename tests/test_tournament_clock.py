@@ -0,0 +1,120 @@
+from time import sleep
+
+from tournament_clock import ClockScheduler, TournamentClock
+from tournament_types import BlindLevel, TournamentType
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def structure():
+    # 10 minute levels with a 5 minute break after the second
+    return [BlindLevel(25, 50, 0, 10), BlindLevel(50, 100, 0, 10), BlindLevel(50, 100, 0, 5, is_break=True),
+            BlindLevel(100, 200, 25, 10), BlindLevel(150, 300, 25, 10)]
+
+def test_pause_and_resume_exclude_paused_time():
+    time = FakeTime()
+    clock = TournamentClock(structure(), time)
+    clock.start()
+    time.now += 400
+    clock.pause()
+    time.now += 10_000
+    assert clock.elapsed() == 400
+    assert clock.state().remaining_seconds == 200
+    clock.start()
+    time.now += 300
+    state = clock.state()
+    assert (state.level, state.remaining_seconds, state.running) == (1, 500, True)
+    time.now += 500
+    assert clock.state().is_break
+    time.now += 10_000
+    assert clock.state().finished
+
+def test_adding_time_extends_the_current_level():
+    time = FakeTime()
+    clock = TournamentClock(structure(), time)
+    clock.seek(3)
+    clock.start()
+    time.now += 60
+    clock.adjust(300)
+    state = clock.state()
+    assert (state.level, state.remaining_seconds) == (3, 840)
+    assert clock.level_start(3) == 1500
+    # Later levels keep their length
+    time.now += 840
+    assert clock.state().level == 4
+    assert clock.state().remaining_seconds == 600
+
+def test_taking_time_off_never_skips_past_the_next_level():
+    time = FakeTime()
+    clock = TournamentClock(structure(), time)
+    clock.start()
+    time.now += 100
+    clock.adjust(-200)
+    assert clock.state().remaining_seconds == 300
+    clock.adjust(-10_000)
+    state = clock.state()
+    assert (state.level, state.remaining_seconds) == (1, 600)
+
+def test_manager_adjust_keeps_the_level(make_manager):
+    time = FakeTime()
+    manager = make_manager(TournamentType.REGULAR, blind_structure=structure())
+    manager.clock.time_source = time
+    manager.set_level(3)
+    manager.start_clock()
+    time.now += 60
+    manager.adjust_clock(300)
+    assert manager.current_level == 3
+    assert manager.clock.state().remaining_seconds == 840
+
+def test_scheduler_advances_many_tournaments(make_manager):
+    time = FakeTime()
+    scheduler = ClockScheduler(time)
+    managers = []
+    for offset in range(3):
+        manager = make_manager(TournamentType.REGULAR, blind_structure=structure())
+        manager.clock.time_source = time
+        manager.start_clock()
+        manager.clock.adjust(-100 * offset)
+        scheduler.add(manager)
+        managers.append(manager)
+    assert len(scheduler) == 3
+    assert scheduler.next_deadline() == time.now + 400
+
+    time.now += 400
+    assert scheduler.run_pending() == 1
+    assert [m.current_level for m in managers] == [0, 0, 1]
+
+    managers[0].pause_clock()
+    time.now += 200
+    assert scheduler.run_pending() == 1
+    assert [m.current_level for m in managers] == [0, 1, 1]
+    managers[0].start_clock()
+    time.now += 10_000
+    while scheduler.run_pending():
+        pass
+    assert [m.current_level for m in managers] == [4, 4, 4]
+    assert scheduler.next_deadline() is None
+
+    scheduler.remove(managers[0])
+    assert len(scheduler) == 2
+
+def test_scheduler_thread_applies_level_changes(make_manager):
+    manager = make_manager(TournamentType.REGULAR,
+                           blind_structure=[BlindLevel(25, 50, 0, 1), BlindLevel(50, 100, 0, 1)])
+    scheduler = ClockScheduler()
+    scheduler.add(manager)
+    scheduler.start()
+    try:
+        manager.start_clock()
+        manager.adjust_clock(-59.95)
+        for _ in range(200):
+            if manager.current_level == 1:
+                break
+            sleep(0.01)
+        assert manager.current_level == 1
+    finally:
+        scheduler.stop()
@@ -0,0 +1,266 @@
+import heapq
+import itertools
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from event_bus import ChangeEvent, ChangeType
+from tournament_types import BlindLevel
+
+@dataclass
+class ClockState:
+    level: int
+    remaining_seconds: float
+    is_break: bool
+    running: bool
+    finished: bool
+
+class TournamentClock:
+    """Headless tournament clock driven by a monotonic time source.
+
+    The clock never counts ticks. It stores the elapsed tournament time
+    banked across pauses plus the monotonic timestamp it was last started
+    at, and derives the level, the time left in it and the break state from
+    those. A late or missed update cannot make it drift.
+    """
+
+    def __init__(self, blind_structure: List[BlindLevel],
+                 time_source: Callable[[], float] = time.monotonic):
+        self.time_source = time_source
+        self._banked = 0.0
+        self._started_at: Optional[float] = None
+        self.set_structure(blind_structure)
+
+    def set_structure(self, blind_structure: List[BlindLevel]) -> None:
+        self.blind_structure = blind_structure
+        self._level_ends: List[float] = []
+        end = 0.0
+        for level in blind_structure:
+            end += level.duration_minutes * 60
+            self._level_ends.append(end)
+
+    @property
+    def running(self) -> bool:
+        return self._started_at is not None
+
+    def start(self, now: Optional[float] = None) -> None:
+        """Start or resume the clock"""
+        if self._started_at is None:
+            self._started_at = self.time_source() if now is None else now
+
+    def pause(self, now: Optional[float] = None) -> None:
+        if self._started_at is not None:
+            self._banked = self.elapsed(now)
+            self._started_at = None
+
+    def elapsed(self, now: Optional[float] = None) -> float:
+        """Tournament seconds played so far, excluding paused time"""
+        if self._started_at is None:
+            return max(self._banked, 0.0)
+        if now is None:
+            now = self.time_source()
+        return max(self._banked + (now - self._started_at), 0.0)
+
+    def level_start(self, level: int) -> float:
+        return self._level_ends[level - 1] if level > 0 else 0.0
+
+    def seek(self, level: int, now: Optional[float] = None, offset: float = 0.0) -> None:
+        """Jump to ``offset`` seconds into ``level``, keeping the running state"""
+        if now is None:
+            now = self.time_source()
+        self._banked = self.level_start(level) + offset
+        if self._started_at is not None:
+            self._started_at = now
+
+    def adjust(self, seconds: float, now: Optional[float] = None) -> None:
+        """Add (or with a negative value, remove) time from the current level.
+
+        The current level's end moves and every later level moves with it,
+        so added time never reaches back into the previous level and taking
+        off more than is left only ends the current one.
+        """
+        elapsed = self.elapsed(now)
+        level = self.level_at(elapsed)
+        ends = self._level_ends
+        shift = max(ends[level] + seconds, elapsed) - ends[level]
+        for i in range(level, len(ends)):
+            ends[i] += shift
+
+    def level_at(self, elapsed: float) -> int:
+        return min(bisect_right(self._level_ends, elapsed), len(self._level_ends) - 1)
+
+    def state(self, now: Optional[float] = None) -> ClockState:
+        elapsed = self.elapsed(now)
+        level = self.level_at(elapsed)
+        end = self._level_ends[level]
+        return ClockState(
+            level=level,
+            remaining_seconds=max(end - elapsed, 0.0),
+            is_break=self.blind_structure[level].is_break,
+            running=self.running,
+            finished=elapsed >= end and level == len(self._level_ends) - 1
+        )
+
+    def next_deadline(self, now: Optional[float] = None) -> Optional[float]:
+        """Monotonic time of the next level change, or None if there is none"""
+        if self._started_at is None:
+            return None
+        if now is None:
+            now = self.time_source()
+        elapsed = self.elapsed(now)
+        index = bisect_right(self._level_ends, elapsed)
+        if index >= len(self._level_ends) - 1:
+            return None
+        return now + (self._level_ends[index] - elapsed)
+
+class ClockScheduler:
+    """Drives the clocks of many tournaments from one thread or event loop.
+
+    Each running tournament has one entry in a heap keyed by its next level
+    change, so a wake-up costs O(log n) whatever the number of events.
+    Entries are invalidated lazily: pausing, resuming or seeking a clock
+    bumps its generation and pushes a fresh entry. Level changes are
+    applied through ``TournamentManager.sync_clock``, so they are journaled
+    and published like manual ones, from the scheduler's thread under the
+    manager's lock.
+    """
+
+    def __init__(self, time_source: Callable[[], float] = time.monotonic):
+        self.time_source = time_source
+        self._heap: List[Tuple[float, int, int, int]] = []  # deadline, seq, key, generation
+        self._managers: Dict[int, object] = {}
+        self._generations: Dict[int, int] = {}
+        self._listeners: Dict[int, Callable[[ChangeEvent], None]] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        # Set while run_async is active; asyncio is imported only then
+        self._wakeup = None
+        self._loop = None
+
+    def add(self, manager) -> None:
+        key = id(manager)
+        with self._condition:
+            self._managers[key] = manager
+            self._generations[key] = 0
+        listener = lambda event, manager=manager: self.reschedule(manager)
+        self._listeners[key] = listener
+        manager.events.subscribe(ChangeType.CLOCK_CHANGED, listener)
+        self.reschedule(manager)
+
+    def remove(self, manager) -> None:
+        key = id(manager)
+        listener = self._listeners.pop(key, None)
+        if listener is not None:
+            manager.events.unsubscribe(ChangeType.CLOCK_CHANGED, listener)
+        with self._condition:
+            self._managers.pop(key, None)
+            self._generations.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._managers)
+
+    def reschedule(self, manager, now: Optional[float] = None) -> None:
+        """Recompute a tournament's next deadline after its clock changed"""
+        if now is None:
+            now = self.time_source()
+        key = id(manager)
+        with self._condition:
+            if key not in self._managers:
+                return
+            generation = self._generations[key] + 1
+            self._generations[key] = generation
+            deadline = manager.clock.next_deadline(now)
+            if deadline is not None:
+                heapq.heappush(self._heap, (deadline, next(self._sequence), key, generation))
+            self._condition.notify()
+        self._wake_async()
+
+    def next_deadline(self) -> Optional[float]:
+        with self._condition:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _discard_stale(self) -> None:
+        heap = self._heap
+        while heap and self._generations.get(heap[0][2]) != heap[0][3]:
+            heapq.heappop(heap)
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """Apply every level change that is due; returns how many fired"""
+        if now is None:
+            now = self.time_source()
+        due = []
+        with self._condition:
+            heap = self._heap
+            while True:
+                self._discard_stale()
+                if not heap or heap[0][0] > now:
+                    break
+                _, _, key, _ = heapq.heappop(heap)
+                self._generations[key] += 1
+                due.append(self._managers[key])
+        for manager in due:
+            manager.sync_clock(now)
+            self.reschedule(manager, now)
+        return len(due)
+
+    # Threaded driver
+
+    def start(self) -> None:
+        """Run the scheduler on a background daemon thread"""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run_thread, name="clock-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run_thread(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopping:
+                    return
+                self._discard_stale()
+                timeout = None
+                if self._heap:
+                    timeout = max(self._heap[0][0] - self.time_source(), 0.0)
+                if timeout is None or timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+            self.run_pending()
+
+    # asyncio driver
+
+    async def run_async(self) -> None:
+        """Run the scheduler as a task on the current event loop until cancelled"""
+        import asyncio
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                self.run_pending()
+                deadline = self.next_deadline()
+                self._wakeup.clear()
+                timeout = None if deadline is None else max(deadline - self.time_source(), 0.0)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+            self._loop = None
+
+    def _wake_async(self) -> None:
+        if self._wakeup is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
@@ -1,33 +1,402 @@
+import functools
+import threading
 from decimal import Decimal
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Sequence, Set, Tuple, Union
 from tournament_types import *
+from player_registry import PlayerRegistry
+from payout_engine import PayoutTable
+from event_bus import EventBus, ChangeType
+from tournament_clock import TournamentClock
+from seating import SeatingEngine, SeatMove
+from chip_stats import ChipLeaderboard, ChipStats, chip_stats
+from money import Cents, to_cents, to_decimal, split
+from event_journal import (EventJournal, OP_ADD_PLAYER, OP_ELIMINATE,
+                           OP_BOUNTY, OP_LEVEL, OP_HAND_FOR_HAND, OP_PRIZE_POOL,
+                           OP_CHIPS, OP_REMOVE_PLAYER, OP_BLIND_STRUCTURE, OP_REENTER)
+
+def _locked(method):
+    """Run a manager method under the manager's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class _PrefixCredits:
+    """Fenwick tree of amounts credited to prefixes of a ranked list.
+
+    ``add(end, amount)`` credits ``amount`` to every index below ``end``;
+    ``at(i)`` returns the total credited to index ``i``. Both are O(log n).
+    """
+
+    __slots__ = ('_tree', '_total')
+
+    def __init__(self, size: int):
+        self._tree = [0] * (size + 1)
+        self._total = 0
+
+    def add(self, end: int, amount: Cents) -> None:
+        self._total += amount
+        tree = self._tree
+        while end < len(tree):
+            tree[end] += amount
+            end += end & -end
+
+    def split(self, amount: Cents, count: int) -> None:
+        """Credit ``amount`` split exactly over the first ``count`` indexes"""
+        share, remainder = divmod(amount, count)
+        if share:
+            self.add(count, share)
+        if remainder:
+            self.add(remainder, 1)
+
+    def at(self, index: int) -> Cents:
+        total = self._total
+        tree = self._tree
+        while index > 0:
+            total -= tree[index]
+            index -= index & -index
+        return total
 
 class TournamentManager:
     def __init__(self, tournament_type: TournamentType, 
                  buy_in: Decimal,
                  blind_structure: List[BlindLevel],
                  payout_structures: List[PayoutStructure],
-                 bounty_amount: Optional[Decimal] = None):
+                 bounty_amount: Optional[Decimal] = None,
+                 journal: Optional[EventJournal] = None,
+                 starting_stack: int = 0,
+                 late_registration_levels: Optional[int] = None):
+        if tournament_type == TournamentType.PKO and bounty_amount is None:
+            raise ValueError("A PKO tournament needs a bounty amount")
         self.tournament_type = tournament_type
         self.buy_in = buy_in
         self.blind_structure = blind_structure
         self.payout_structures = sorted(payout_structures, key=lambda x: x.min_players)
         self.bounty_amount = bounty_amount
-        self.players: Dict[int, Player] = {}
+        self.players = PlayerRegistry()
         self.current_level = 0
         self.hand_for_hand = False
-        self.total_prize_pool = Decimal('0')
+        self.prize_pool_cents: Cents = 0
+        self.journal = journal
+        self.events = EventBus()
+        self.clock = TournamentClock(blind_structure)
+        self.seating: Optional[SeatingEngine] = None
+        self.seat_moves: List[SeatMove] = []
+        self.starting_stack = starting_stack
+        # Entries, re-entries and rebuys are accepted until this many levels
+        # have been played; None keeps registration open
+        self.late_registration_levels = late_registration_levels
+        self.chips = ChipLeaderboard()
+        # Operations may come from the clock scheduler's thread as well as
+        # the caller's, so each one applies and journals its events under this
+        self._lock = threading.RLock()
+
+    # Money is tracked in integer cents; the Decimal attributes below are the
+    # display/configuration boundary and keep the cents values in sync.
+    @property
+    def buy_in(self) -> Decimal:
+        return to_decimal(self._buy_in_cents)
+
+    @buy_in.setter
+    def buy_in(self, value: Decimal) -> None:
+        self._buy_in_cents = to_cents(value)
+
+    @property
+    def bounty_amount(self) -> Optional[Decimal]:
+        return None if self._bounty_cents is None else to_decimal(self._bounty_cents)
+
+    @bounty_amount.setter
+    def bounty_amount(self, value: Optional[Decimal]) -> None:
+        self._bounty_cents = None if value is None else to_cents(value)
+
+    @property
+    def payout_structures(self) -> List[PayoutStructure]:
+        """Copies of the payout structures; assign the property to change them"""
+        return self.payout_table.copies()
+
+    @payout_structures.setter
+    def payout_structures(self, structures: List[PayoutStructure]) -> None:
+        self.payout_table = PayoutTable(structures)
+
+    @property
+    def total_prize_pool(self) -> Decimal:
+        return to_decimal(self.prize_pool_cents)
+
+    def _commit(self, *events) -> None:
+        """Journal one operation's effects and notify listeners of them"""
+        if self.journal is not None:
+            self.journal.append(self, events)
+        if self.seating is not None:
+            self._update_seating(events)
+        if self.events.has_listeners():
+            self._publish(events)
+
+    def _update_seating(self, events) -> None:
+        seated = [event[1] for event in events if event[0] == OP_ADD_PLAYER]
+        busted = [event[1] for event in events if event[0] in (OP_ELIMINATE, OP_REMOVE_PLAYER)]
+        moves = []
+        if busted:
+            moves.extend(self.seating.remove_players(busted))
+        if seated:
+            moves.extend(self.seating.seat_players(seated))
+        if moves:
+            self.seat_moves.extend(moves)
+            self.events.emit(ChangeType.SEATS_CHANGED, moves)
+
+    @_locked
+    def start_seating(self, table_size: int = 9, final_table_size: Optional[int] = None,
+                      break_order: Optional[Sequence[int]] = None,
+                      seed: Optional[int] = None) -> List[SeatMove]:
+        """Draw every remaining player to a table and keep tables balanced from now on.
+
+        Registrations and eliminations after the draw produce seat moves,
+        collected until ``take_seat_moves`` and published as SEATS_CHANGED.
+        """
+        self.seating = SeatingEngine(table_size, final_table_size, break_order, seed)
+        assignments = self.seating.draw(player.id for player in self.players.active())
+        self.seat_moves = []
+        self.events.emit(ChangeType.SEATS_CHANGED, assignments)
+        return assignments
+
+    @_locked
+    def take_seat_moves(self) -> List[SeatMove]:
+        """Seat moves since the last call, in the order the floor should make them"""
+        moves, self.seat_moves = self.seat_moves, []
+        return moves
+
+    def _publish(self, events) -> None:
+        bus = self.events
+        with bus.batch():
+            players_changed = False
+            for event in events:
+                op = event[0]
+                if op == OP_BOUNTY:
+                    bus.emit(ChangeType.BOUNTY_UPDATED, event[2], key=event[1])
+                elif op == OP_ELIMINATE:
+                    bus.emit(ChangeType.PLAYER_ELIMINATED, event[2], key=event[1])
+                    players_changed = True
+                elif op == OP_ADD_PLAYER:
+                    bus.emit(ChangeType.PLAYER_ADDED, event[3], key=event[1])
+                    players_changed = True
+                elif op == OP_REMOVE_PLAYER:
+                    bus.emit(ChangeType.PLAYER_REMOVED, key=event[1])
+                    bus.emit(ChangeType.CHIPS_CHANGED, self.chips.total_chips)
+                    players_changed = True
+                elif op == OP_PRIZE_POOL:
+                    bus.emit(ChangeType.PRIZE_POOL_CHANGED, event[1])
+                elif op == OP_LEVEL:
+                    bus.emit(ChangeType.LEVEL_CHANGED, event[1])
+                elif op == OP_HAND_FOR_HAND:
+                    bus.emit(ChangeType.HAND_FOR_HAND_CHANGED, event[1])
+                elif op == OP_CHIPS:
+                    bus.emit(ChangeType.CHIPS_CHANGED, self.chips.total_chips)
+            if players_changed:
+                bus.emit(ChangeType.PLAYERS_REMAINING_CHANGED, self.players.active_count)
+
+    @_locked
+    def restore(self) -> int:
+        """Rebuild state from the journal's latest snapshot and tail.
+
+        The configuration recorded in the journal (type, buy-in, bounty,
+        starting stack, late registration and blind structure) replaces
+        the one this manager was created with.
+        """
+        if self.journal is None:
+            raise ValueError("No journal configured for this tournament")
+        replayed = self.journal.restore(self)
+        self.clock.set_structure(self.blind_structure)
+        self.chips.rebuild((player.id, player.chips) for player in self.players.active())
+        self.clock.seek(self.current_level)
+        bus = self.events
+        with bus.batch():
+            bus.emit(ChangeType.LEVEL_CHANGED, self.current_level)
+            bus.emit(ChangeType.HAND_FOR_HAND_CHANGED, self.hand_for_hand)
+            bus.emit(ChangeType.PRIZE_POOL_CHANGED, self.prize_pool_cents)
+            bus.emit(ChangeType.PLAYERS_REMAINING_CHANGED, self.players.active_count)
+            bus.emit(ChangeType.CHIPS_CHANGED, self.chips.total_chips)
+            bus.emit(ChangeType.CLOCK_CHANGED)
+        return replayed
         
+    @property
+    def registration_open(self) -> bool:
+        return self.late_registration_levels is None or self.current_level < self.late_registration_levels
+
+    def _check_registration(self) -> None:
+        if not self.registration_open:
+            raise ValueError("Registration is closed")
+
     def add_player(self, name: str) -> Player:
-        player_id = len(self.players) + 1
-        bounty = self.bounty_amount if self.tournament_type == TournamentType.PKO else None
-        player = Player(id=player_id, name=name, bounty=bounty)
-        self.players[player_id] = player
-        self.total_prize_pool += self.buy_in
+        return self.register_players((name,))[0]
+
+    @_locked
+    def register_players(self, names: Iterable[str]) -> List[Player]:
+        """Register a batch of entries as one operation.
+
+        IDs are consecutive, the prize pool grows by one multiplication
+        and the whole batch is journaled as a single frame.
+        """
+        return self._register(names)
+
+    def _register(self, names: Iterable[str], reentry: Optional[Player] = None) -> List[Player]:
+        self._check_registration()
+        bounty = self._bounty_cents if self.tournament_type == TournamentType.PKO else None
+        players = self.players.add_many(names, bounty)
+        if not players:
+            return players
+        stack = self.starting_stack
+        events: List[tuple] = []
+        if reentry is not None:
+            reentry.reentered = True
+            events.append((OP_REENTER, reentry.id))
+        for player in players:
+            player.chips = stack
+            events.append((OP_ADD_PLAYER, player.id, bounty, player.name))
+            events.append((OP_CHIPS, player.id, stack))
+        self.chips.set_many({player.id: stack for player in players})
+        self.prize_pool_cents += self._buy_in_cents * len(players)
+        events.append((OP_PRIZE_POOL, self.prize_pool_cents))
+        self._commit(*events)
+        return players
+
+    @_locked
+    def reenter(self, player_id: int) -> Player:
+        """Buy a busted player back in as a new entry under a new ID.
+
+        Each busted entry can be re-entered once; the new entry can be
+        re-entered in turn when it busts.
+        """
+        player = self.players[player_id]
+        if not player.eliminated:
+            raise ValueError(f"{player.name} is still in the tournament")
+        if player.reentered:
+            raise ValueError(f"Entry {player_id} has already been re-entered")
+        return self._register((player.name,), player)[0]
+
+    @_locked
+    def rebuy(self, player_id: int, chips: Optional[int] = None) -> Player:
+        """Add a buy-in's worth of chips to a player still in.
+
+        The buy-in goes to the prize pool; in PKO events the bounty part
+        of the rebuy is added to the player's bounty.
+        """
+        self._check_registration()
+        player = self.players.get_active(player_id)
+        if player is None:
+            raise ValueError(f"Player {player_id} is not in the tournament")
+        player.chips += self.starting_stack if chips is None else chips
+        self.chips.set(player_id, player.chips)
+        self.prize_pool_cents += self._buy_in_cents
+        events = [(OP_CHIPS, player_id, player.chips), (OP_PRIZE_POOL, self.prize_pool_cents)]
+        if self.tournament_type == TournamentType.PKO:
+            player.bounty_cents = (player.bounty_cents or 0) + self._bounty_cents
+            events.append((OP_BOUNTY, player_id, player.bounty_cents, player.bounty_won_cents))
+        self._commit(*events)
         return player
+
+    @_locked
+    def remove_entry(self, player_id: int) -> Decimal:
+        """Withdraw an entry that has not played a pot yet and return the refund.
+
+        The buy-in (and bounty in PKO events) is refunded. Entries can only
+        be withdrawn while registration is open and while they still have
+        exactly the starting stack and bounty. The ID is not reused.
+        """
+        self._check_registration()
+        player = self.players.get_active(player_id)
+        if player is None:
+            raise ValueError(f"Player {player_id} is not in the tournament")
+        if player.chips != self.starting_stack:
+            raise ValueError(f"{player.name} has already played with their stack")
+        refund = self._buy_in_cents
+        if self.tournament_type == TournamentType.PKO:
+            if player.bounty_won_cents or (player.bounty_cents or 0) > self._bounty_cents:
+                raise ValueError(f"{player.name} has already won bounties")
+            refund += player.bounty_cents or 0
+        self.players.remove(player_id)
+        self.chips.remove(player_id)
+        self.prize_pool_cents -= self._buy_in_cents
+        self._commit((OP_REMOVE_PLAYER, player_id), (OP_PRIZE_POOL, self.prize_pool_cents))
+        return to_decimal(refund)
+
+    @_locked
+    def update_chip_counts(self, counts: Dict[int, int]) -> None:
+        """Record counted stacks (player id -> chips) as one operation"""
+        for player_id, chips in counts.items():
+            if not self.players.is_active(player_id):
+                raise ValueError(f"Player {player_id} is not in the tournament")
+            if chips < 0:
+                raise ValueError("Chip counts cannot be negative")
+        events = []
+        for player_id, chips in counts.items():
+            self.players[player_id].chips = chips
+            events.append((OP_CHIPS, player_id, chips))
+        self.chips.set_many(counts)
+        self._commit(*events)
+
+    def set_chip_count(self, player_id: int, chips: int) -> None:
+        self.update_chip_counts({player_id: chips})
+
+    def _transfer_chips(self, busted: Sequence[Player], winners: Sequence[Player],
+                        events: List[tuple]) -> None:
+        """Move busted stacks to the pot winners, split evenly between them"""
+        total = 0
+        for player in busted:
+            total += self.chips.remove(player.id)
+            player.chips = 0
+            events.append((OP_CHIPS, player.id, 0))
+        for player, share in zip(winners, split(total, len(winners))):
+            if share:
+                player.chips += share
+                self.chips.set(player.id, player.chips)
+                events.append((OP_CHIPS, player.id, player.chips))
         
+    @_locked
     def process_knockout(self, eliminator_id: int, eliminated_id: int) -> Decimal:
         """Process a single knockout in a PKO tournament"""
+        self._validate_knockout(eliminator_id, eliminated_id, set())
+        events: List[tuple] = []
+        prizes: Dict[int, Cents] = {}
+        self._apply_knockout(eliminator_id, eliminated_id, events, prizes)
+        self._commit(*events)
+        return to_decimal(prizes[eliminator_id])
+        
+    @_locked
+    def process_multiway_allin(self, result: MultiwayAllInResult) -> Dict[int, Decimal]:
+        """Process a multiway all-in situation, returning bounty prizes won"""
+        self._validate_multiway(result, set())
+        events: List[tuple] = []
+        prizes: Dict[int, Cents] = {}
+        self._apply_multiway(result, events, prizes)
+        self._commit(*events)
+        return {player_id: to_decimal(cents) for player_id, cents in prizes.items()}
+
+    @_locked
+    def process_eliminations(self, batch: Sequence[Union[Knockout, MultiwayAllInResult]]) -> Dict[int, Decimal]:
+        """Apply several knockouts and multiway all-ins as one transaction.
+
+        Every entry is validated against the state left by the entries
+        before it, and nothing is applied unless the whole batch is valid.
+        Returns the total immediate bounty prizes won per player.
+        """
+        gone: Set[int] = set()
+        for item in batch:
+            if isinstance(item, Knockout):
+                self._validate_knockout(item.eliminator_id, item.eliminated_id, gone)
+            else:
+                self._validate_multiway(item, gone)
+                
+        events: List[tuple] = []
+        prizes: Dict[int, Cents] = {}
+        for item in batch:
+            if isinstance(item, Knockout):
+                self._apply_knockout(item.eliminator_id, item.eliminated_id, events, prizes)
+            else:
+                self._apply_multiway(item, events, prizes)
+        self._commit(*events)
+        return {player_id: to_decimal(cents) for player_id, cents in prizes.items()}
+
+    def _validate_knockout(self, eliminator_id: int, eliminated_id: int, gone: Set[int]) -> None:
         if self.tournament_type != TournamentType.PKO:
             raise ValueError("Knockout processing only available in PKO tournaments")
             
@@ -37,100 +406,259 @@ class TournamentManager:
         eliminated_player = self.players[eliminated_id]
         eliminator = self.players[eliminator_id]
         
-        if eliminated_player.eliminated:
+        if eliminated_player.eliminated or eliminated_id in gone:
             raise ValueError("This player has already been eliminated")
             
-        if eliminator.eliminated:
+        if eliminator.eliminated or eliminator_id in gone:
             raise ValueError("The eliminator has already been eliminated")
+        gone.add(eliminated_id)
+
+    def _apply_knockout(self, eliminator_id: int, eliminated_id: int,
+                        events: List[tuple], prizes: Dict[int, Cents]) -> None:
+        eliminated_player = self.players[eliminated_id]
+        eliminator = self.players[eliminator_id]
+        bounty = eliminated_player.bounty_cents
+        if bounty is None:
+            # Players registered before the bounty was configured
+            bounty = self._bounty_cents
             
-        bounty = eliminated_player.bounty
-        if not bounty or bounty != self.bounty_amount:
-            # Reset bounty to correct amount if it's somehow different
-            bounty = self.bounty_amount
-            eliminated_player.bounty = bounty
-            
-        # Half of bounty goes to eliminator immediately
-        immediate_prize = (bounty / 2).quantize(Decimal('0.01'))
-        # Other half gets added to eliminator's bounty
-        eliminator.bounty += bounty - immediate_prize
+        # Half of bounty goes to eliminator immediately, the other half
+        # (the smaller one on an odd cent) gets added to their bounty
+        immediate_prize, added = split(bounty, 2)
+        eliminator.bounty_won_cents += immediate_prize
+        eliminator.bounty_cents += added
+        eliminated_player.bounty_cents = 0
+        prizes[eliminator_id] = prizes.get(eliminator_id, 0) + immediate_prize
         
-        eliminated_player.eliminated = True
-        return immediate_prize
-        
-    def process_multiway_allin(self, result: MultiwayAllInResult) -> Dict[int, Decimal]:
-        """Process a multiway all-in situation, returning bounty prizes won"""
-        bounty_prizes: Dict[int, Decimal] = {}
-        if self.tournament_type != TournamentType.PKO:
-            return bounty_prizes
-            
-        # Validate no self-eliminations (player can't finish behind themselves)
-        player_positions = {p.id: result.finishing_positions[p.id] for p in result.players}
-        for player in result.players:
-            others_ahead = [p for p in result.players 
-                          if result.finishing_positions[p.id] < result.finishing_positions[player.id]]
-            if player in others_ahead:
-                raise ValueError("Invalid positions: A player cannot eliminate themselves")
-            
-        # Update player positions and elimination status
+        self.players.eliminate(eliminated_id)
+        self._transfer_chips((eliminated_player,), (eliminator,), events)
+        events.append((OP_BOUNTY, eliminated_id, 0, eliminated_player.bounty_won_cents))
+        events.append((OP_BOUNTY, eliminator_id, eliminator.bounty_cents, eliminator.bounty_won_cents))
+        events.append((OP_ELIMINATE, eliminated_id, eliminated_player.position))
+
+    def _validate_multiway(self, result: MultiwayAllInResult, gone: Set[int]) -> None:
+        positions = result.finishing_positions
+        seen: Set[int] = set()
+        has_winner = False
         for player in result.players:
-            position = result.finishing_positions[player.id]
-            player.position = position
-            if position != 1:  # Not the winner
-                if player.eliminated:
-                    raise ValueError(f"Player {player.name} has already been eliminated")
-                player.eliminated = True
-                
-        # Process bounties for eliminated players
-        for eliminated in result.players:
-            if eliminated.position == 1:  # Skip the winner
-                continue
-                
-            bounty = eliminated.bounty
-            if not bounty or bounty != self.bounty_amount:
-                # Reset bounty to correct amount if it's somehow different
-                bounty = self.bounty_amount
-                eliminated.bounty = bounty
-                
-            # Find players who finished better (lower position number)
-            eliminators = [
-                p for p in result.players 
-                if p.position < eliminated.position
-            ]
+            position = positions.get(player.id)
+            if position is None:
+                raise ValueError(f"No finishing position given for {player.name}")
+            if position < 1:
+                raise ValueError("Invalid positions: finishing positions start at 1")
+            if player.id in seen:
+                raise ValueError(f"Player {player.name} is listed more than once")
+            seen.add(player.id)
+            if self.players[player.id].eliminated or player.id in gone:
+                raise ValueError(f"Player {player.name} has already been eliminated")
+            has_winner = has_winner or position == 1
+        if not has_winner:
+            raise ValueError("Invalid positions: nobody finished first in the pot")
+        gone.update(player.id for player in result.players if positions[player.id] != 1)
+
+    def _apply_multiway(self, result: MultiwayAllInResult,
+                        events: List[tuple], prizes: Dict[int, Cents]) -> None:
+        """Resolve a validated multiway pot in O(k log k).
+
+        Players are sorted once by pot position. Everyone who finished ahead
+        of an eliminated player forms a prefix of that order, so each
+        eliminated bounty is credited to a prefix through a Fenwick tree
+        instead of being added to each eliminator in turn. Pot positions
+        are settled worst first, so a player busting in the same pot passes
+        on the bounty they collected from those below them. Players sharing
+        a pot position share the finishing place, and the busted stacks are
+        split between the players who won the pot.
+        """
+        positions = result.finishing_positions
+        ranked = sorted((self.players[p.id] for p in result.players),
+                        key=lambda p: (positions[p.id], p.id))
+        count = len(ranked)
+        group_starts = [i for i in range(count)
+                        if i == 0 or positions[ranked[i].id] != positions[ranked[i - 1].id]]
+        pko = self.tournament_type == TournamentType.PKO
+        won = _PrefixCredits(count)
+        bounty_added = _PrefixCredits(count)
+        eliminated: List[Player] = []
+        
+        group_end = count
+        for start in reversed(group_starts[1:]):  # the first group won the pot
+            place = self.players.active_count - (group_end - start) + 1
+            for i in range(start, group_end):
+                player = ranked[i]
+                if pko:
+                    bounty = player.bounty_cents
+                    if bounty is None:
+                        bounty = self._bounty_cents
+                    immediate, added = split(bounty + bounty_added.at(i), 2)
+                    won.split(immediate, start)
+                    bounty_added.split(added, start)
+                    player.bounty_cents = 0
+                self.players.eliminate(player.id, place)
+                eliminated.append(player)
+            group_end = start
             
-            if eliminators:
-                # Split immediate bounty equally among eliminators
-                share = (bounty / 2 / len(eliminators)).quantize(Decimal('0.01'))
-                remaining = bounty / 2
-                
-                for eliminator in eliminators:
-                    bounty_prizes[eliminator.id] = (
-                        bounty_prizes.get(eliminator.id, Decimal('0')) + 
-                        share
-                    )
-                    # Add equal share to eliminator's bounty
-                    eliminator.bounty += remaining / len(eliminators)
-                    
-        return bounty_prizes
+        if pko:
+            for i, player in enumerate(ranked):
+                amount = won.at(i)
+                if amount:
+                    player.bounty_won_cents += amount
+                    prizes[player.id] = prizes.get(player.id, 0) + amount
+                if i < group_end:  # still in the tournament
+                    player.bounty_cents += bounty_added.at(i)
+            events.extend((OP_BOUNTY, p.id, p.bounty_cents, p.bounty_won_cents) for p in ranked)
+        self._transfer_chips(eliminated, ranked[:group_end], events)
+        events.extend((OP_ELIMINATE, p.id, p.position) for p in eliminated)
         
     def get_active_payout_structure(self) -> PayoutStructure:
         """Get the appropriate payout structure based on number of players"""
-        num_players = len(self.players)
-        for structure in reversed(self.payout_structures):
-            if num_players >= structure.min_players:
-                return structure
-        return self.payout_structures[0]  # Fallback to smallest structure
+        return self.payout_table.structure_for(len(self.players))
         
     def calculate_prize(self, position: int) -> Optional[Decimal]:
         """Calculate prize money for a given position"""
-        structure = self.get_active_payout_structure()
-        if position not in structure.positions:
-            return None
-        return (self.total_prize_pool * structure.positions[position]).quantize(Decimal('0.01'))
+        prize = self.payout_table.prize(len(self.players), self.prize_pool_cents, position)
+        return None if prize is None else to_decimal(prize)
+
+    def get_player_prizes(self) -> Dict[int, Decimal]:
+        """Prize for every paid player, by player ID.
+
+        Players who finished in the same place share the prizes of all the
+        places they cover, split to the cent; players still in are treated
+        as sharing first place. The prizes add up to what the board pays.
+        """
+        entries = len(self.players)
+        pool = self.prize_pool_cents
+        groups: Dict[int, List[int]] = {}
+        for player in self.players.values():
+            position = player.position if player.eliminated else 1
+            groups.setdefault(position, []).append(player.id)
+        prizes: Dict[int, Decimal] = {}
+        for position, player_ids in groups.items():
+            total = sum(self.payout_table.prize(entries, pool, place) or 0
+                        for place in range(position, position + len(player_ids)))
+            if total:
+                for player_id, share in zip(sorted(player_ids), split(total, len(player_ids))):
+                    prizes[player_id] = to_decimal(share)
+        return prizes
+
+    def get_payout_board(self) -> List[Tuple[int, Decimal]]:
+        """Every paid place with its prize, best place first"""
+        return [(place, to_decimal(amount)) for place, amount
+                in self.payout_table.board(len(self.players), self.prize_pool_cents)]
+
+    def get_next_pay_jump(self) -> Optional[Tuple[int, Decimal]]:
+        """The next place paying more than the next player out will receive"""
+        jump = self.payout_table.next_pay_jump(
+            len(self.players), self.prize_pool_cents, self.players.active_count)
+        return None if jump is None else (jump[0], to_decimal(jump[1]))
         
     def get_remaining_players(self) -> int:
         """Get number of players still in the tournament"""
-        return sum(1 for p in self.players.values() if not p.eliminated)
+        return self.players.active_count
         
+    def get_chip_stats(self) -> ChipStats:
+        """Total and average stack, in big blinds and as an M-ratio.
+
+        During a break the figures are measured against the next level
+        that is played.
+        """
+        level = self.get_current_level_info()
+        if level.is_break:
+            level = next((l for l in self.blind_structure[self.current_level:] if not l.is_break), level)
+        table_size = self.seating.table_size if self.seating is not None else 9
+        return chip_stats(self.chips.total_chips, len(self.chips), level, table_size)
+
+    def get_chip_leaders(self, count: int = 10) -> List[Tuple[Player, int]]:
+        """The ``count`` biggest stacks with their chips, chip leader first"""
+        return [(self.players[player_id], chips) for player_id, chips in self.chips.top(count)]
+
+    def get_chip_rank(self, player_id: int) -> int:
+        """A player's place in the chip counts (1 = chip leader)"""
+        return self.chips.rank(player_id)
+
     def get_current_level_info(self) -> BlindLevel:
         """Get current blind level information"""
-        return self.blind_structure[self.current_level]
\ No newline at end of file
+        return self.blind_structure[self.current_level]
+
+    @_locked
+    def set_level(self, level: int) -> None:
+        """Move the tournament to the given blind level"""
+        if not 0 <= level < len(self.blind_structure):
+            raise ValueError(f"Level {level + 1} is outside the blind structure")
+        self.current_level = level
+        self._commit((OP_LEVEL, level))
+        if self.clock.level_at(self.clock.elapsed()) != level:
+            # A manual level change restarts the clock at that level
+            self.clock.seek(level)
+            self.events.emit(ChangeType.CLOCK_CHANGED)
+
+    @_locked
+    def set_blind_structure(self, blind_structure: List[BlindLevel]) -> None:
+        """Swap in a new schedule, e.g. one re-planned for a bigger field.
+
+        Play moves to the new level whose big blind is closest to the
+        current one (a break stays a break when the new schedule has
+        breaks), nearest the current level number on ties, with the time
+        already played in the level carried over.
+        """
+        if not blind_structure:
+            raise ValueError("A blind structure needs at least one level")
+        played = self.clock.elapsed() - self.clock.level_start(self.current_level)
+        level = self._matching_level(blind_structure)
+        self.blind_structure = blind_structure
+        self.clock.set_structure(blind_structure)
+        self.clock.seek(level, offset=played)
+        self.current_level = level
+        self._commit((OP_BLIND_STRUCTURE, tuple(blind_structure)), (OP_LEVEL, level))
+        self.events.emit(ChangeType.CLOCK_CHANGED)
+
+    def _matching_level(self, blind_structure: List[BlindLevel]) -> int:
+        current = self.blind_structure[self.current_level]
+        candidates = [i for i, level in enumerate(blind_structure) if level.is_break == current.is_break]
+        return min(candidates or range(len(blind_structure)),
+                   key=lambda i: (abs(blind_structure[i].big_blind - current.big_blind),
+                                  abs(i - self.current_level)))
+
+    def next_level(self) -> None:
+        if self.current_level < len(self.blind_structure) - 1:
+            self.set_level(self.current_level + 1)
+
+    def previous_level(self) -> None:
+        if self.current_level > 0:
+            self.set_level(self.current_level - 1)
+
+    @_locked
+    def set_hand_for_hand(self, enabled: bool) -> None:
+        self.hand_for_hand = enabled
+        self._commit((OP_HAND_FOR_HAND, enabled))
+
+    @_locked
+    def toggle_hand_for_hand(self) -> bool:
+        self.set_hand_for_hand(not self.hand_for_hand)
+        return self.hand_for_hand
+
+    @_locked
+    def start_clock(self) -> None:
+        """Start or resume the tournament clock"""
+        self.clock.start()
+        self.events.emit(ChangeType.CLOCK_CHANGED)
+
+    @_locked
+    def pause_clock(self) -> None:
+        self.clock.pause()
+        self.events.emit(ChangeType.CLOCK_CHANGED)
+
+    @_locked
+    def adjust_clock(self, seconds: float) -> None:
+        """Add time to the current level; negative values take time off"""
+        self.clock.adjust(seconds)
+        self.sync_clock()
+        self.events.emit(ChangeType.CLOCK_CHANGED)
+
+    @_locked
+    def sync_clock(self, now: Optional[float] = None) -> int:
+        """Move to the level the clock says we should be in"""
+        level = self.clock.level_at(self.clock.elapsed(now))
+        if level != self.current_level:
+            self.current_level = level
+            self._commit((OP_LEVEL, level))
+        return level
@@ -2,6 +2,7 @@ from enum import Enum
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from decimal import Decimal
+from money import Cents, to_cents, to_decimal
 
 class TournamentType(Enum):
     REGULAR = "Regular"
@@ -13,20 +14,41 @@ class BlindLevel:
     big_blind: int
     ante: int
     duration_minutes: int
+    is_break: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     id: int
     name: str
-    bounty: Optional[Decimal] = None
+    bounty_cents: Optional[Cents] = None
     eliminated: bool = False
     position: Optional[int] = None
+    bounty_won_cents: Cents = 0  # immediate bounty prizes collected so far
+    chips: int = 0
+    reentered: bool = False  # this busted entry has been bought back in
+
+    @property
+    def bounty(self) -> Optional[Decimal]:
+        return None if self.bounty_cents is None else to_decimal(self.bounty_cents)
+
+    @bounty.setter
+    def bounty(self, value: Optional[Decimal]) -> None:
+        self.bounty_cents = None if value is None else to_cents(value)
+
+    @property
+    def bounty_won(self) -> Decimal:
+        return to_decimal(self.bounty_won_cents)
 
 @dataclass
 class PayoutStructure:
     positions: Dict[int, Decimal]  # position -> percentage of prize pool
     min_players: int  # minimum number of players for this structure
 
+@dataclass
+class Knockout:
+    eliminator_id: int
+    eliminated_id: int
+
 @dataclass
 class MultiwayAllInResult:
     players: List[Player]